@@ -0,0 +1,206 @@
+"""
+Analytic astronomical functions
+
+Pure-Python computations of equinoxes and solar terms, based on the
+analytic series published in Jean Meeus' "Astronomical Algorithms"
+(chapter 25, "Solar coordinates" and chapter 27, "Equinoxes and solstices").
+They need no data file and cover any year. Equinoxes are precise to about
+a minute. Solar terms are precise to about 0.01 degree of longitude: up to
+about 15 minutes, and biased early (by about 4 minutes on average, compared
+to Skyfield). Close to midnight, the resulting date may be one day early.
+"""
+from datetime import datetime, timedelta
+from math import cos, radians, sin
+try:
+    # As of Python 3.9, included in the stdlib
+    from zoneinfo import ZoneInfo
+except ImportError:  # pre-3.9
+    from backports.zoneinfo import ZoneInfo
+
+# Julian day of the J2000.0 epoch, 2000-01-01 12:00 TT
+J2000 = 2451545.0
+# Mean tropical year, in days
+TROPICAL_YEAR = 365.242189
+# Solutions are refined until they're within a second.
+precision = 1 / 86400
+
+# Mean March and September equinoxes polynomials (Meeus, table 27.B), valid
+# from year 1000 to 3000
+MARCH_EQUINOX = (2451623.80984, 365242.37404, 0.05169, -0.00411, -0.00057)
+SEPTEMBER_EQUINOX = (
+    2451810.21715, 365242.01767, -0.11575, 0.00337, 0.00078
+)
+# Periodic terms of the equinoxes (Meeus, table 27.C): A, B, C
+EQUINOX_TERMS = (
+    (485, 324.96, 1934.136),
+    (203, 337.23, 32964.467),
+    (199, 342.08, 20.186),
+    (182, 27.85, 445267.112),
+    (156, 73.14, 45036.886),
+    (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934),
+    (74, 296.72, 3034.906),
+    (70, 243.58, 9037.513),
+    (58, 119.81, 33718.147),
+    (52, 297.17, 150.678),
+    (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562),
+    (44, 325.15, 31555.956),
+    (29, 60.93, 4443.417),
+    (18, 155.12, 67555.328),
+    (17, 288.79, 4562.452),
+    (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921),
+    (12, 95.39, 14577.848),
+    (12, 287.11, 31931.756),
+    (12, 320.81, 34777.259),
+    (9, 227.73, 1222.114),
+    (8, 15.45, 16859.074),
+)
+
+
+def delta_t(year):
+    """
+    Return the difference between the Terrestrial Time and the Universal
+    Time, in seconds, for the given (decimal) year.
+
+    Polynomial expressions by Espenak & Meeus, from 1800 on.
+    """
+    if year < 1800 or year >= 2150:
+        u = (year - 1820) / 100
+        return -20 + 32 * u ** 2
+    if year < 1860:
+        t = year - 1800
+        return (
+            13.72 - 0.332447 * t + 0.0068612 * t ** 2 + 0.0041116 * t ** 3
+            - 0.00037436 * t ** 4 + 0.0000121272 * t ** 5
+            - 0.0000001699 * t ** 6 + 0.000000000875 * t ** 7
+        )
+    if year < 1900:
+        t = year - 1860
+        return (
+            7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3
+            - 0.0004473624 * t ** 4 + t ** 5 / 233174
+        )
+    if year < 1920:
+        t = year - 1900
+        return (
+            -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3
+            - 0.000197 * t ** 4
+        )
+    if year < 1941:
+        t = year - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if year < 1961:
+        t = year - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if year < 1986:
+        t = year - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if year < 2005:
+        t = year - 2000
+        return (
+            63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+            + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5
+        )
+    if year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    u = (year - 1820) / 100
+    return -20 + 32 * u ** 2 - 0.5628 * (2150 - year)
+
+
+def sun_longitude(jde, apparent=True):
+    """
+    Return the Sun ecliptic longitude, in degrees, referred to the true
+    equinox of date, at the given Julian Ephemeris Day.
+
+    If ``apparent`` is False, the aberration isn't applied: it's the
+    geometric direction of the Sun.
+    """
+    # Julian centuries since J2000.0
+    t = (jde - J2000) / 36525
+    mean_longitude = 280.46646 + 36000.76983 * t + 0.0003032 * t ** 2
+    mean_anomaly = radians(
+        357.52911 + 35999.05029 * t - 0.0001537 * t ** 2
+    )
+    center = (
+        (1.914602 - 0.004817 * t - 0.000014 * t ** 2) * sin(mean_anomaly)
+        + (0.019993 - 0.000101 * t) * sin(2 * mean_anomaly)
+        + 0.000289 * sin(3 * mean_anomaly)
+    )
+    # Longitude of the ascending node of the Moon orbit, for the nutation
+    node = radians(125.04 - 1934.136 * t)
+    longitude = mean_longitude + center - 0.00478 * sin(node)
+    if apparent:
+        longitude -= 0.00569
+    return longitude % 360
+
+
+def find_longitude(year, degrees, apparent=True):
+    """
+    Return the Julian Day (UT) at which the Sun reaches the given ecliptic
+    longitude, in the given year.
+    """
+    jan_first = datetime(year, 1, 1)
+    # Julian Day at January 1st, 00:00 UT
+    jd = J2000 - .5 + (jan_first - datetime(2000, 1, 1)).days
+    jde = jd + delta_t(year) / 86400
+    # First approximation, using the mean motion of the Sun
+    difference = (degrees - sun_longitude(jde, apparent)) % 360
+    jde += TROPICAL_YEAR * difference / 360
+    while True:
+        difference = (degrees - sun_longitude(jde, apparent) + 180) % 360
+        correction = TROPICAL_YEAR * (difference - 180) / 360
+        jde += correction
+        if abs(correction) < precision:
+            break
+    return jde - delta_t(year + (jde - jd) / TROPICAL_YEAR) / 86400
+
+
+def find_equinox(year, polynomial):
+    """
+    Return the Julian Day (UT) of an equinox, using the given mean equinox
+    polynomial (see ``MARCH_EQUINOX`` and ``SEPTEMBER_EQUINOX``).
+    """
+    y = (year - 2000) / 1000
+    jde = sum(coefficient * y ** i for i, coefficient in enumerate(polynomial))
+    t = (jde - J2000) / 36525
+    w = radians(35999.373 * t - 2.47)
+    delta_lambda = 1 + 0.0334 * cos(w) + 0.0007 * cos(2 * w)
+    periodic = sum(
+        a * cos(radians(b + c * t)) for a, b, c in EQUINOX_TERMS
+    )
+    jde += 0.00001 * periodic / delta_lambda
+    return jde - delta_t(year) / 86400
+
+
+def to_date(jd, timezone):
+    """
+    Convert a Julian Day (UT) into a date in the given timezone.
+    """
+    moment = datetime(2000, 1, 1, 12, tzinfo=ZoneInfo('UTC')) \
+        + timedelta(days=jd - J2000)
+    return moment.astimezone(ZoneInfo(timezone)).date()
+
+
+def calculate_equinoxes(year, timezone='UTC'):
+    """ calculate equinox with time zone """
+    if 1000 <= year <= 3000:
+        vernal = find_equinox(year, MARCH_EQUINOX)
+        autumn = find_equinox(year, SEPTEMBER_EQUINOX)
+    else:
+        vernal = find_longitude(year, 0)
+        autumn = find_longitude(year, 180)
+    return to_date(vernal, timezone), to_date(autumn, timezone)
+
+
+def solar_term(year, degrees, timezone='UTC'):
+    """
+    Returns the date of the solar term for the given longitude
+    and the given year.
+
+    As for :func:`workalendar.skyfield_astronomy.solar_term`, the longitude
+    is the geometric one (no aberration).
+    """
+    return to_date(find_longitude(year, degrees, apparent=False), timezone)
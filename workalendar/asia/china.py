@@ -105,13 +105,18 @@ class China(ChineseNewYearCalendar):
     shift_new_years_day = True
     include_chinese_new_year_eve = True
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.extra_working_days = []
-        for year, data in workdays.items():
-            for holiday_name, day_list in data.items():
-                for v in day_list:
-                    self.extra_working_days.append(date(year, v[0], v[1]))
+    @property
+    def extra_working_days(self):
+        """
+        List of all the configured shifted working days.
+
+        Read-only: see ``get_extra_working_days(year)``.
+        """
+        return [
+            day
+            for year in workdays
+            for day in self.get_extra_working_days(year)
+        ]
 
     def get_calendar_holidays(self, year):
         year_min, year_max = min(holidays), max(holidays)
@@ -131,8 +136,9 @@ class China(ChineseNewYearCalendar):
             days.append((ChineseNewYearCalendar.lunar(year, 1, i),
                          "Spring Festival"))
         # National Days, 10.1 - 10.7 in general
+        extra_working_days = self.get_extra_working_days(year)
         for i in range(1, 8):
-            if date(year, 10, i) not in self.extra_working_days:
+            if date(year, 10, i) not in extra_working_days:
                 days.append((date(year, 10, i), "National Day"))
 
         # other holidays
@@ -141,25 +147,9 @@ class China(ChineseNewYearCalendar):
                 days.append((date(year, v[0], v[1]), holiday_name))
         return days
 
-    def is_working_day(self, day,
-                       extra_working_days=None, extra_holidays=None):
-        extra_working_days = extra_working_days or self.extra_working_days
-        return super().is_working_day(day, extra_working_days, extra_holidays)
-
-    def add_working_days(self, day, delta,
-                         extra_working_days=None, extra_holidays=None,
-                         keep_datetime=False):
-        extra_working_days = extra_working_days or self.extra_working_days
-        return super().add_working_days(day, delta,
-                                        extra_working_days,
-                                        extra_holidays,
-                                        keep_datetime)
-
-    def sub_working_days(self, day, delta,
-                         extra_working_days=None, extra_holidays=None,
-                         keep_datetime=False):
-        extra_working_days = extra_working_days or self.extra_working_days
-        return super().sub_working_days(day, delta,
-                                        extra_working_days,
-                                        extra_holidays,
-                                        keep_datetime)
+    def get_extra_working_days(self, year):
+        days = super().get_extra_working_days(year)
+        for holiday_name, day_list in workdays.get(year, {}).items():
+            for v in day_list:
+                days.append(date(year, v[0], v[1]))
+        return days
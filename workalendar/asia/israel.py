@@ -1,6 +1,8 @@
-from pyluach.dates import GregorianDate, HebrewDate
+from datetime import timedelta
+import warnings
 
-from ..core import Calendar, FRI, SAT
+from ..core import Calendar, MON, FRI, SAT
+from ..hebrew import get_nisan_first, TISHREI_OFFSET
 from ..registry_tools import iso_register
 
 
@@ -10,55 +12,87 @@ class Israel(Calendar):
     include_new_years_day = False
     WEEKEND_DAYS = (SAT, FRI)
 
+    # Days after the 1st of Nisan
+    NISAN_HOLIDAYS = (
+        (13, "Pesach Eve"),
+        (14, "Pesach"),
+        (19, "7th of Pesach Eve"),
+        (20, "7th of Pesach"),
+        (63, "Shavout Eve"),
+        (64, "Shavout"),
+    )
+    # Days after the 1st of Tishrei (Rosh Hashana)
+    TISHREI_HOLIDAYS = (
+        (-1, "Rosh Hashana Eve"),
+        (0, "Rosh Hashana"),
+        (1, "Rosh Hashana"),
+        (8, "Yom Kippur Eve"),
+        (9, "Yom Kippur"),
+        (13, "Sukkot Eve"),
+        (14, "Sukkot"),
+        (20, "Shmini Atzeres Eve"),
+        (21, "Shmini Atzeres"),
+    )
+
     def get_variable_days(self, year):
         days = super().get_variable_days(year)
 
-        hebrew_date = GregorianDate(year=year, month=1, day=1).to_heb()
-        jewish_year = hebrew_date.year
+        nisan_first = get_nisan_first(year)
+        tishrei_first = nisan_first + timedelta(days=TISHREI_OFFSET)
+        for delta, label in self.NISAN_HOLIDAYS:
+            days.append((nisan_first + timedelta(days=delta), label))
+        for delta, label in self.TISHREI_HOLIDAYS:
+            days.append((tishrei_first + timedelta(days=delta), label))
+        days.extend(self.get_independence_day(year))
+        return days
 
-        holidays_hebrew_dates = [
-            (HebrewDate(jewish_year, 6, 29), "Rosh Hashana Eve"),
-            (HebrewDate(jewish_year + 1, 7, 1), "Rosh Hashana"),
-            (HebrewDate(jewish_year + 1, 7, 2), "Rosh Hashana"),
-            (HebrewDate(jewish_year + 1, 7, 9), "Yom Kippur Eve"),
-            (HebrewDate(jewish_year + 1, 7, 10), "Yom Kippur"),
-            (HebrewDate(jewish_year + 1, 7, 14), "Sukkot Eve"),
-            (HebrewDate(jewish_year + 1, 7, 15), "Sukkot"),
-            (HebrewDate(jewish_year + 1, 7, 21), "Shmini Atzeres Eve"),
-            (HebrewDate(jewish_year + 1, 7, 22), "Shmini Atzeres"),
-            (HebrewDate(jewish_year, 1, 14), "Pesach Eve"),
-            (HebrewDate(jewish_year, 1, 15), "Pesach"),
-            (HebrewDate(jewish_year, 1, 20), "7th of Pesach Eve"),
-            (HebrewDate(jewish_year, 1, 21), "7th of Pesach"),
-            (HebrewDate(jewish_year, 3, 5), "Shavout Eve"),
-            (HebrewDate(jewish_year, 3, 6), "Shavout"),
-        ]
-        holidays_hebrew_dates += self.get_hebrew_independence_day(jewish_year)
+    def get_independence_day(self, year):
+        """
+        Returns the independence day eve and independence day dates
+        for the given Gregorian year.
 
-        for holiday_hebrew_date, holiday_name in holidays_hebrew_dates:
-            days.append((holiday_hebrew_date.to_pydate(), holiday_name))
-        return days
+        It's the 5th of Iyar, moved backwards if it falls on FRI or SAT, or
+        forward if it falls on MON.
+
+        :return: independence day dates in the type of List[Tuple[date, str]]
+        """
+        # 5th of Iyar, Nisan has 30 days
+        independence_day = get_nisan_first(year) + timedelta(days=34)
+        weekday = independence_day.weekday()
+        if weekday == FRI:
+            independence_day -= timedelta(days=1)
+        elif weekday == SAT:
+            independence_day -= timedelta(days=2)
+        elif weekday == MON:
+            independence_day += timedelta(days=1)
+        return [
+            (independence_day - timedelta(days=1), "Independence Day Eve"),
+            (independence_day, "Independence Day"),
+        ]
 
     def get_hebrew_independence_day(self, jewish_year):
         """
         Returns the independence day eve and independence day dates
         according to the given hebrew year
 
+        Deprecated: use :meth:`get_independence_day` instead, working with
+        Gregorian years and dates.
+
         :param jewish_year: the specific hebrew year for calculating
                             the independence day dates
         :return: independence day dates
                  in the type of List[Tuple[HebrewDate, str]]
         """
-        month = 2
-        day = 5
-        original_hebrew_independence_date = HebrewDate(jewish_year, month, day)
-        if original_hebrew_independence_date.weekday() == 6:
-            day = 4
-        if original_hebrew_independence_date.weekday() == 7:
-            day = 3
-        if original_hebrew_independence_date.weekday() == 2:
-            day = 6
+        warnings.warn(
+            "`Israel.get_hebrew_independence_day()` is deprecated, use"
+            " `Israel.get_independence_day()` instead.",
+            DeprecationWarning,
+        )
+        from pyluach.dates import HebrewDate
+        # The Nisan and Iyar months of the Jewish year are in this Gregorian
+        # year.
+        year = jewish_year - 3760
         return [
-            (HebrewDate(jewish_year, month, day - 1), "Independence Day Eve"),
-            (HebrewDate(jewish_year, month, day), "Independence Day")
+            (HebrewDate.from_pydate(day), label)
+            for day, label in self.get_independence_day(year)
         ]
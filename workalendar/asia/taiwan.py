@@ -1,6 +1,6 @@
 from datetime import date
 
-from ..core import ChineseNewYearCalendar, cleaned_date
+from ..core import ChineseNewYearCalendar
 from ..astronomy import solar_term
 from ..registry_tools import iso_register
 
@@ -16,11 +16,11 @@ class Taiwan(ChineseNewYearCalendar):
     include_chinese_new_year_eve = True
     include_chinese_second_day = True
 
-    def is_working_day(self, day, *args, **kwargs):
-        day = cleaned_date(day)
-        if day in (date(2021, 2, 20), date(2021, 9, 11)):
-            return True
-        return super().is_working_day(day, *args, **kwargs)
+    def get_extra_working_days(self, year):
+        days = super().get_extra_working_days(year)
+        if year == 2021:
+            days.extend([date(year, 2, 20), date(year, 9, 11)])
+        return days
 
     def get_variable_days(self, year):
         days = super().get_variable_days(year)
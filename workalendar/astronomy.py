@@ -1,9 +1,81 @@
+"""
+Astronomical functions
+
+With Skyfield, the results are computed by Skyfield and stored in the
+astronomy cache (see :data:`workalendar.cache.astronomy_cache`), so each of
+them is only computed once. Without Skyfield, pre-computed results are used,
+and analytic ones out of the pre-computed years and time zones.
+"""
+from datetime import date
+
+from .cache import astronomy_cache
+
 try:
     import skyfield  # noqa: F401
     import skyfield_data  # noqa: F401
-    from .skyfield_astronomy import calculate_equinoxes, solar_term
+    from . import skyfield_astronomy
+
+    def calculate_equinoxes(year, timezone='UTC'):
+        """ calculate equinox with time zone """
+        # Results of other Skyfield or ephemeris versions are ignored
+        skyfield_version = skyfield_astronomy.get_version()
+        cached = astronomy_cache.get(
+            'skyfield', 'equinoxes', timezone, year,
+            backend_version=skyfield_version,
+        )
+        if cached is not None:
+            return tuple(date.fromordinal(equinox) for equinox in cached)
+        result = skyfield_astronomy.calculate_equinoxes(year, timezone)
+        astronomy_cache.set(
+            'skyfield', 'equinoxes', timezone, year, 0,
+            [equinox.toordinal() for equinox in result],
+            backend_version=skyfield_version,
+        )
+        return result
+
+    def solar_term(year, degrees, timezone='UTC'):
+        """
+        Returns the date of the solar term for the given longitude
+        and the given year.
+        """
+        skyfield_version = skyfield_astronomy.get_version()
+        cached = astronomy_cache.get(
+            'skyfield', 'solar_term', timezone, year, degrees,
+            backend_version=skyfield_version,
+        )
+        if cached is not None:
+            return date.fromordinal(cached[0])
+        result = skyfield_astronomy.solar_term(year, degrees, timezone)
+        astronomy_cache.set(
+            'skyfield', 'solar_term', timezone, year, degrees,
+            [result.toordinal()],
+            backend_version=skyfield_version,
+        )
+        return result
+
 except ImportError:
-    from .precomputed_astronomy import calculate_equinoxes, solar_term
+    from . import analytic_astronomy, precomputed_astronomy
+
+    # Analytic results are cheaper to compute than to read from the cache.
+    def calculate_equinoxes(year, timezone='UTC'):
+        """
+        Pre-computed equinoxes, or analytic ones out of the pre-computed
+        years and time zones.
+        """
+        try:
+            return precomputed_astronomy.calculate_equinoxes(year, timezone)
+        except NotImplementedError:
+            return analytic_astronomy.calculate_equinoxes(year, timezone)
+
+    def solar_term(year, degrees, timezone='UTC'):
+        """
+        Pre-computed solar term, or analytic one out of the pre-computed
+        years and time zones.
+        """
+        try:
+            return precomputed_astronomy.solar_term(year, degrees, timezone)
+        except NotImplementedError:
+            return analytic_astronomy.solar_term(year, degrees, timezone)
 
 __all__ = [
     'calculate_equinoxes',
@@ -0,0 +1,381 @@
+"""
+Cache tools
+"""
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from datetime import date
+import os
+from pathlib import Path
+import sys
+import threading
+from time import monotonic
+import warnings
+
+from . import __version__
+
+
+class LRUCache(MutableMapping):
+    """
+    Bounded mapping, to be used as a per-year cache for calendars.
+
+    * ``max_years``: maximum number of entries. When it's reached, the least
+      recently used entry is evicted. ``None`` means no limit.
+    * ``ttl``: time to live of the entries, in seconds. An expired entry is
+      evicted when accessed. ``None`` means that entries never expire.
+    """
+
+    def __init__(self, max_years=None, ttl=None, timer=monotonic):
+        if max_years is not None and max_years < 1:
+            raise ValueError("`max_years` should be a positive integer")
+        self.max_years = max_years
+        self.ttl = ttl
+        self.timer = timer
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, expires = self._data[key]
+            if expires is not None and expires <= self.timer():
+                del self._data[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.max_years is not None:
+                while len(self._data) > self.max_years:
+                    self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class SharedCache:
+    """
+    Process-wide holidays cache, shared by the calendar instances.
+
+    Entries are keyed by calendar class, constructor arguments and year, so
+    that fresh instances reuse the holidays computed by other instances of
+    the same class, built with the same arguments. It's disabled by default:
+
+    >>> from workalendar.cache import shared_cache
+    >>> shared_cache.enable()
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._data = {}
+
+    def enable(self, max_entries=None):
+        """
+        Enable the shared cache.
+
+        ``max_entries`` bounds the number of (calendar, year) entries.
+        """
+        if max_entries is None:
+            self._data = {}
+        else:
+            self._data = LRUCache(max_years=max_entries)
+        self.enabled = True
+
+    def disable(self):
+        "Disable and empty the shared cache"
+        self.enabled = False
+        self._data = {}
+
+    def clear(self):
+        self._data.clear()
+
+    def get(self, key):
+        try:
+            return self._data[key]
+        except KeyError:
+            return None
+
+    def set(self, key, value):
+        self._data[key] = value
+
+    def __len__(self):
+        return len(self._data)
+
+
+shared_cache = SharedCache()
+
+
+class SQLiteCache:
+    """
+    Base class of the caches persisted in a local SQLite database file.
+
+    Subclasses define the ``table`` name and its ``schema``. ``sqlite3`` and
+    ``json`` are only imported when a cache is used: importing workalendar
+    doesn't pay for these opt-in features.
+    """
+    # Seconds to wait for a lock held by another process
+    timeout = 30
+    table = None
+    schema = None
+
+    def __init__(self):
+        self.path = None
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def enable(self, path):
+        "Enable the cache, stored in the given file path"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        with self._connect() as connection:
+            # Write-ahead logging lets readers and a writer work concurrently
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} ({self.schema})'
+            )
+
+    def disable(self):
+        self.path = None
+
+    @contextmanager
+    def _connect(self):
+        import sqlite3
+        # One connection per operation: safe across threads and forks.
+        connection = sqlite3.connect(str(self.path), timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute(f'DELETE FROM {self.table}')
+
+
+class PersistentCache(SQLiteCache):
+    """
+    Holidays cache persisted in a local SQLite database file.
+
+    Entries are keyed by calendar class path, constructor arguments, library
+    version and year, so they survive restarts and can be shared between the
+    processes of the same host. It's disabled by default:
+
+    >>> from workalendar.cache import persistent_cache
+    >>> persistent_cache.enable('/var/cache/workalendar.sqlite')
+    """
+    table = 'holidays'
+    schema = (
+        'calendar TEXT NOT NULL,'
+        ' configuration TEXT NOT NULL,'
+        ' version TEXT NOT NULL,'
+        ' year INTEGER NOT NULL,'
+        ' holidays TEXT NOT NULL,'
+        ' PRIMARY KEY (calendar, configuration, version, year)'
+    )
+
+    @staticmethod
+    def _get_key(cls, configuration, year):
+        return (
+            f'{cls.__module__}.{cls.__qualname__}',
+            repr(configuration),
+            __version__,
+            year,
+        )
+
+    def get(self, cls, configuration, year):
+        """
+        Return the holidays stored for this calendar class, configuration
+        and year, or None if there's none.
+        """
+        import json
+        import sqlite3
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    'SELECT holidays FROM holidays WHERE calendar = ?'
+                    ' AND configuration = ? AND version = ? AND year = ?',
+                    self._get_key(cls, configuration, year)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            warnings.warn(f"Persistent holidays cache unavailable: {exc}")
+            return None
+        if row is None:
+            return None
+        return [
+            (date.fromisoformat(day), label)
+            for day, label in json.loads(row[0])
+        ]
+
+    def set(self, cls, configuration, year, holidays):
+        "Store the holidays of this calendar class, configuration and year"
+        import json
+        import sqlite3
+        value = json.dumps([
+            (day.isoformat(), label) for day, label in holidays
+        ])
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO holidays'
+                    ' (calendar, configuration, version, year, holidays)'
+                    ' VALUES (?, ?, ?, ?, ?)',
+                    self._get_key(cls, configuration, year) + (value,)
+                )
+        except sqlite3.Error as exc:
+            warnings.warn(f"Persistent holidays cache unavailable: {exc}")
+
+
+persistent_cache = PersistentCache()
+
+
+def user_cache_dir():
+    """
+    Return the workalendar directory in the user cache directory.
+
+    It can be overridden with the ``WORKALENDAR_CACHE_DIR`` environment
+    variable.
+    """
+    path = os.environ.get('WORKALENDAR_CACHE_DIR')
+    if path:
+        return Path(path)
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') \
+            or Path.home() / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'workalendar'
+
+
+class AstronomyCache(SQLiteCache):
+    """
+    Astronomical results cache, persisted in a SQLite database file.
+
+    Entries are keyed by backend, function, time zone, year, degrees and
+    version: the workalendar version, followed by the backend version.
+    Values are lists of date ordinals.
+
+    It's enabled by default, in the user cache directory (see
+    :func:`user_cache_dir`), on first use. It can be disabled, or stored
+    elsewhere:
+
+    >>> from workalendar.cache import astronomy_cache
+    >>> astronomy_cache.enable('/var/cache/workalendar-astronomy.sqlite')
+    >>> astronomy_cache.disable()
+    """
+    table = 'astronomy'
+    schema = (
+        'backend TEXT NOT NULL,'
+        ' function TEXT NOT NULL,'
+        ' timezone TEXT NOT NULL,'
+        ' year INTEGER NOT NULL,'
+        ' degrees INTEGER NOT NULL,'
+        ' version TEXT NOT NULL,'
+        ' value TEXT NOT NULL,'
+        ' PRIMARY KEY (backend, function, timezone, year, degrees, version)'
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.auto_enable = True
+
+    def disable(self):
+        super().disable()
+        self.auto_enable = False
+
+    def _auto_enable(self):
+        "Enable the cache in the user cache directory, if not done yet"
+        if self.path is None and self.auto_enable:
+            import sqlite3
+            self.auto_enable = False
+            try:
+                self.enable(user_cache_dir() / 'astronomy.sqlite')
+            except (OSError, sqlite3.Error) as exc:
+                self.path = None
+                warnings.warn(f"Astronomy cache unavailable: {exc}")
+        return self.enabled
+
+    @staticmethod
+    def _version(backend_version):
+        return f'{__version__} {backend_version}'.rstrip()
+
+    def get(self, backend, function, timezone, year, degrees=0,
+            backend_version=''):
+        """
+        Return the value stored for this computation, or None if there's
+        none.
+        """
+        if not self._auto_enable():
+            return None
+        import json
+        import sqlite3
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    'SELECT value FROM astronomy WHERE backend = ?'
+                    ' AND function = ? AND timezone = ? AND year = ?'
+                    ' AND degrees = ? AND version = ?',
+                    (
+                        backend, function, timezone, year, degrees,
+                        self._version(backend_version),
+                    )
+                ).fetchone()
+        except sqlite3.Error as exc:
+            warnings.warn(f"Astronomy cache unavailable: {exc}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, backend, function, timezone, year, degrees, value,
+            backend_version=''):
+        "Store the value of this computation"
+        if not self._auto_enable():
+            return
+        import json
+        import sqlite3
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO astronomy'
+                    ' (backend, function, timezone, year, degrees, version,'
+                    ' value) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        backend, function, timezone, year, degrees,
+                        self._version(backend_version), json.dumps(value),
+                    )
+                )
+        except sqlite3.Error as exc:
+            warnings.warn(f"Astronomy cache unavailable: {exc}")
+
+
+astronomy_cache = AstronomyCache()
@@ -1,25 +1,30 @@
 """
 Working day tools
 """
+from array import array
+from bisect import bisect_left
 from copy import copy
+from functools import lru_cache, partial
+import heapq
+from importlib import import_module
 import warnings
 from calendar import monthrange
 from datetime import date, timedelta, datetime
 from pathlib import Path
 import sys
-
-import convertdate
-from dateutil import easter
-from lunardate import LunarDate
+import threading
 
 from .exceptions import (
     UnsupportedDateType, CalendarError,
     ICalExportRangeError, ICalExportTargetPathError
 )
+from .cache import LRUCache, shared_cache, persistent_cache
 from . import __version__
 
 MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
 ISO_MON, ISO_TUE, ISO_WED, ISO_THU, ISO_FRI, ISO_SAT, ISO_SUN = range(1, 8)
+# Easter computation methods, same values as the ``dateutil.easter`` ones.
+EASTER_JULIAN, EASTER_ORTHODOX, EASTER_WESTERN = range(1, 4)
 
 
 class classproperty:
@@ -65,6 +70,108 @@ def daterange(start, end):
         day += timedelta(days=1)
 
 
+class DateSet:
+    """
+    Immutable and hashable set of dates.
+
+    It can be used as ``extra_working_days`` or ``extra_holidays`` arguments
+    of the calendar methods. Its dates are cleaned once, when it's built, so
+    you may reuse it as many times as needed, with no additional cost:
+
+    >>> extra_holidays = DateSet([date(2018, 12, 24), date(2018, 12, 31)])
+    >>> cal.is_working_day(date(2018, 12, 24), extra_holidays=extra_holidays)
+    False
+    """
+    __slots__ = ('_ordinals', '_sorted')
+
+    def __init__(self, days=()):
+        self._ordinals = frozenset(
+            cleaned_date(day).toordinal() for day in days
+        )
+        self._sorted = array('l', sorted(self._ordinals))
+
+    def __contains__(self, day):
+        return day.toordinal() in self._ordinals
+
+    def __iter__(self):
+        return map(date.fromordinal, self._sorted)
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def __hash__(self):
+        return hash(self._ordinals)
+
+    def __eq__(self, other):
+        if not isinstance(other, DateSet):
+            return NotImplemented
+        return self._ordinals == other._ordinals
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def iter_after(self, day):
+        "Yield the dates strictly after ``day``, in chronological order"
+        index = bisect_left(self._sorted, day.toordinal() + 1)
+        for ordinal in self._sorted[index:]:
+            yield date.fromordinal(ordinal)
+
+    def iter_before(self, day):
+        "Yield the dates strictly before ``day``, in reverse order"
+        index = bisect_left(self._sorted, day.toordinal())
+        for ordinal in reversed(self._sorted[:index]):
+            yield date.fromordinal(ordinal)
+
+
+def as_date_set(days):
+    """
+    Return the given dates as a :class:`DateSet`, or ``None`` if empty.
+
+    A :class:`DateSet` is returned unchanged.
+    """
+    if not days:
+        return None
+    if isinstance(days, DateSet):
+        return days
+    return DateSet(days)
+
+
+def jan_1st_ordinal(year):
+    "Return the proleptic Gregorian ordinal of the January 1st of the year"
+    y = year - 1
+    return y * 365 + y // 4 - y // 100 + y // 400 + 1
+
+
+def year_bitmap(offsets):
+    """
+    Return a compact bitmap (366 bits) out of an iterable of day offsets.
+
+    Offsets are the number of days since the January 1st of the year, i.e.
+    0 for January 1st, 365 for December 31st of a leap year.
+    """
+    bitmap = bytearray(46)
+    for offset in offsets:
+        bitmap[offset >> 3] |= 1 << (offset & 7)
+    return bytes(bitmap)
+
+
+def is_bit_set(bitmap, offset):
+    "Return True if the bit for this day offset is set in the bitmap"
+    return bool(bitmap[offset >> 3] >> (offset & 7) & 1)
+
+
+@lru_cache(maxsize=4096)
+def easter_sunday(year, method):
+    """
+    Return the date of Easter Sunday for the given year and method (one of
+    the ``EASTER_*`` constants).
+
+    Results are memoized and shared by all calendars.
+    """
+    from dateutil import easter
+    return easter.easter(year, method)
+
+
 class ChristianMixin:
     EASTER_METHOD = None  # to be assigned in the inherited mixin
     include_epiphany = False
@@ -140,7 +247,7 @@ class ChristianMixin:
 
     def get_easter_sunday(self, year):
         "Return the date of the easter (sunday) -- following the easter method"
-        return easter.easter(year, self.EASTER_METHOD)
+        return easter_sunday(year, self.EASTER_METHOD)
 
     def get_easter_monday(self, year):
         "Return the date of the monday after easter"
@@ -245,12 +352,12 @@ class WesternMixin(ChristianMixin):
     (chiefly Europe and Northern America)
 
     """
-    EASTER_METHOD = easter.EASTER_WESTERN
+    EASTER_METHOD = EASTER_WESTERN
     WEEKEND_DAYS = (SAT, SUN)
 
 
 class OrthodoxMixin(ChristianMixin):
-    EASTER_METHOD = easter.EASTER_ORTHODOX
+    EASTER_METHOD = EASTER_ORTHODOX
     WEEKEND_DAYS = (SAT, SUN)
 
     include_orthodox_christmas = True
@@ -266,12 +373,40 @@ class OrthodoxMixin(ChristianMixin):
         return days
 
 
+@lru_cache(maxsize=None)
+def lunar_months(year):
+    """
+    Return the Gregorian ordinal of the first day and the length of each
+    (non-leap) month of the given Chinese lunar year.
+
+    Computed once per year and shared by all calendars. Years that are not
+    supported by ``lunardate`` raise a ``ValueError``.
+    """
+    from lunardate import LunarDate
+    months = []
+    for month in range(1, 13):
+        start = LunarDate(year, month, 1).toSolarDate().toordinal()
+        try:
+            LunarDate(year, month, 30).toSolarDate()
+            length = 30
+        except ValueError:
+            length = 29
+        months.append((start, length))
+    return tuple(months)
+
+
 class LunarMixin:
     """
     Calendar ready to compute luncar calendar days
     """
     @staticmethod
     def lunar(year, month, day):
+        if 1 <= month <= 12:
+            start, length = lunar_months(year)[month - 1]
+            if 1 <= day <= length:
+                return date.fromordinal(start + day - 1)
+        # Out of the table: let lunardate raise its own error
+        from lunardate import LunarDate
         return LunarDate(year, month, day).toSolarDate()
 
 
@@ -393,6 +528,33 @@ class ChineseNewYearMixin(LunarMixin):
         return days
 
 
+class LazyModule:
+    """
+    Class attribute whose value is the module ``name``, imported on first
+    access.
+
+    >>> class MyCalendar(CalverterMixin, Calendar):
+    ...     conversion_method = LazyModule('convertdate.hebrew')
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        return import_module(self.name)
+
+
+@lru_cache(maxsize=16384)
+def converted_to_gregorian(conversion_method, year, month, day):
+    """
+    Return the Gregorian date for the given date expressed in the calendar
+    of the ``conversion_method`` (e.g. ``convertdate.islamic``).
+
+    Results are memoized and shared by all calendars.
+    """
+    return date(*conversion_method.to_gregorian(year, month, day))
+
+
 class CalverterMixin:
     conversion_method = None
     ISLAMIC_HOLIDAYS = ()
@@ -403,6 +565,10 @@ class CalverterMixin:
             raise NotImplementedError
 
     def converted(self, year):
+        """
+        Return the list of every day of the (Gregorian) year, converted using
+        the ``conversion_method``.
+        """
         current = date(year, 1, 1)
         delta = timedelta(days=1)
         days = []
@@ -418,8 +584,16 @@ class CalverterMixin:
         return days
 
     def calverted_years(self, year):
-        converted = self.converted(year)
-        return sorted({y for y, m, d in converted})
+        """
+        Return the sorted list of the converted years overlapping the given
+        (Gregorian) year.
+
+        Only its first and last days are converted: the years in-between
+        are deduced.
+        """
+        first, _, _ = self.conversion_method.from_gregorian(year, 1, 1)
+        last, _, _ = self.conversion_method.from_gregorian(year, 12, 31)
+        return list(range(first, last + 1))
 
     def get_islamic_holidays(self):
         return self.ISLAMIC_HOLIDAYS
@@ -437,13 +611,12 @@ class CalverterMixin:
                       'this Islamic calendar computation may be wrong.')
         days = super().get_variable_days(year)
         years = self.calverted_years(year)
+        # Only add a delta if necessary
+        delta = self.get_delta_islamic_holidays(year)
         for month, day, label in self.get_islamic_holidays():
             for y in years:
-                g_date = self.conversion_method.to_gregorian(y, month, day)
-                holiday = date(*g_date)
-
-                # Only add a delta if necessary
-                delta = self.get_delta_islamic_holidays(year)
+                holiday = converted_to_gregorian(
+                    self.conversion_method, y, month, day)
                 if delta:
                     holiday += delta
 
@@ -456,7 +629,7 @@ class IslamicMixin(CalverterMixin):
 
     WEEKEND_DAYS = (FRI, SAT)
 
-    conversion_method = convertdate.islamic
+    conversion_method = LazyModule('convertdate.islamic')
     include_prophet_birthday = False
     include_day_after_prophet_birthday = False
     include_start_ramadan = False
@@ -508,8 +681,85 @@ class CoreCalendar:
     FIXED_HOLIDAYS = ()
     WEEKEND_DAYS = ()
 
+    # Builds the per-year caches of the instances. It should be a class or a
+    # ``functools.partial`` returning an (empty) mutable mapping.
+    cache_factory = dict
+
+    def __new__(cls, *args, **kwargs):
+        # Keep track of the constructor arguments: they're part of the
+        # calendar configuration, used as a key in the shared cache.
+        self = super().__new__(cls)
+        self._init_args = (args, tuple(sorted(kwargs.items())))
+        return self
+
     def __init__(self):
-        self._holidays = {}
+        self._init_caches(self.cache_factory)
+        self._init_locks()
+
+    def _init_locks(self):
+        self._lock = threading.Lock()
+        # One lock per year being computed
+        self._year_locks = {}
+
+    def __getstate__(self):
+        # Locks can't be pickled, they're rebuilt in __setstate__
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        state.pop('_year_locks', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_locks()
+
+    def _get_year_lock(self, year):
+        with self._lock:
+            try:
+                return self._year_locks[year]
+            except KeyError:
+                lock = self._year_locks[year] = threading.RLock()
+                return lock
+
+    def _init_caches(self, factory):
+        self._holidays = factory()
+        self._holidays_bitmaps = factory()
+        self._working_days_bitmaps = factory()
+        self._working_days_counts = factory()
+
+    def _get_caches(self):
+        return (
+            self._holidays,
+            self._holidays_bitmaps,
+            self._working_days_bitmaps,
+            self._working_days_counts,
+        )
+
+    def set_cache_policy(self, max_years=None, ttl=None):
+        """
+        Change the cache policy of this calendar instance.
+
+        * ``max_years``: maximum number of years kept in cache, the least
+          recently used years are evicted first,
+        * ``ttl``: time to live of the cached years, in seconds.
+
+        Calling it with no argument restores the default, unbounded, cache.
+        Already cached years are dropped.
+        """
+        if max_years is None and ttl is None:
+            factory = dict
+        else:
+            factory = partial(LRUCache, max_years=max_years, ttl=ttl)
+        self._init_caches(factory)
+
+    def clear_cache(self):
+        "Drop every year computed and cached by this calendar instance"
+        for cache in self._get_caches():
+            cache.clear()
+
+    def evict(self, year):
+        "Drop the given year from the cache of this calendar instance"
+        for cache in self._get_caches():
+            cache.pop(year, None)
 
     @classproperty
     def name(cls):
@@ -543,15 +793,73 @@ class CoreCalendar:
         if not year:
             year = date.today().year
 
-        if year in self._holidays:
+        try:
             return self._holidays[year]
+        except KeyError:
+            pass
+
+        # Only one thread computes a given year, the others wait for it.
+        with self._get_year_lock(year):
+            try:
+                return self._holidays[year]
+            except KeyError:
+                pass
+            try:
+                return self._compute_holidays(year)
+            finally:
+                with self._lock:
+                    self._year_locks.pop(year, None)
+
+    def _compute_holidays(self, year):
+        """
+        Compute the holidays of the year and store them in the caches.
+
+        The shared and persistent caches, if enabled, are looked up first.
+        """
+        configuration = self._get_cache_configuration()
+        use_shared = shared_cache.enabled and configuration is not None
+        use_persistent = persistent_cache.enabled and configuration is not None
+        shared_key = (self.__class__, configuration, year)
+
+        holidays = None
+        if use_shared:
+            holidays = shared_cache.get(shared_key)
+        if holidays is None and use_persistent:
+            holidays = persistent_cache.get(
+                self.__class__, configuration, year)
+            if holidays is not None and use_shared:
+                shared_cache.set(shared_key, tuple(holidays))
+        if holidays is not None:
+            holidays = list(holidays)
+            self._holidays[year] = holidays
+            return holidays
 
         # Here we process the holiday specific calendar
         temp_calendar = tuple(self.get_calendar_holidays(year))
 
         # it is sorted
-        self._holidays[year] = sorted(temp_calendar)
-        return self._holidays[year]
+        holidays = sorted(temp_calendar)
+        self._holidays[year] = holidays
+        if use_shared:
+            shared_cache.set(shared_key, tuple(holidays))
+        if use_persistent:
+            persistent_cache.set(
+                self.__class__, configuration, year, holidays)
+        return holidays
+
+    def _get_cache_configuration(self):
+        """
+        Return the configuration of this calendar, as used in the shared
+        caches keys, i.e. its constructor arguments.
+
+        Return None if they can't be used as a key.
+        """
+        configuration = getattr(self, '_init_args', None)
+        try:
+            hash(configuration)
+        except TypeError:
+            return None
+        return configuration
 
     def get_holiday_label(self, day):
         """Return the label of the holiday, if the date is a holiday"""
@@ -562,6 +870,91 @@ class CoreCalendar:
         "Return a quick date index (set)"
         return {day for day, label in self.holidays(year)}
 
+    def get_extra_working_days(self, year):
+        """
+        Return a list of dates that are working days for this calendar,
+        even if they fall on a weekend day or on a holiday.
+
+        Override this method if your calendar has "shifted" working days,
+        (e.g. a SAT that is worked to compensate for a bridge holiday).
+        """
+        return []
+
+    def get_holidays_bitmap(self, year):
+        """
+        Return the holidays of the given year as a compact bitmap.
+
+        The bit at offset ``n`` is set if the ``n``-th day of the year
+        (January 1st being 0) is a holiday.
+        """
+        try:
+            return self._holidays_bitmaps[year]
+        except KeyError:
+            pass
+        first_ordinal = jan_1st_ordinal(year)
+        bitmap = year_bitmap(
+            day.toordinal() - first_ordinal
+            for day in self.holidays_set(year) if day.year == year
+        )
+        self._holidays_bitmaps[year] = bitmap
+        return bitmap
+
+    def get_working_days_bitmap(self, year):
+        """
+        Return the working days of the given year as a compact bitmap.
+
+        The bit at offset ``n`` is set if the ``n``-th day of the year
+        (January 1st being 0) is a working day, according to the weekend
+        days, the holidays and the extra working days of the calendar.
+        """
+        try:
+            return self._working_days_bitmaps[year]
+        except KeyError:
+            pass
+        weekend_days = self.get_weekend_days()
+        holidays = self.get_holidays_bitmap(year)
+        first_ordinal = jan_1st_ordinal(year)
+        # Ordinal 1 (January 1st, year 1) is a MON
+        first_weekday = (first_ordinal - 1) % 7
+        extra_working_days = {
+            day.toordinal() - first_ordinal
+            for day in map(cleaned_date, self.get_extra_working_days(year))
+            if day.year == year
+        }
+        length = jan_1st_ordinal(year + 1) - first_ordinal
+        bitmap = year_bitmap(
+            offset for offset in range(length)
+            if offset in extra_working_days or (
+                (first_weekday + offset) % 7 not in weekend_days
+                and not is_bit_set(holidays, offset)
+            )
+        )
+        self._working_days_bitmaps[year] = bitmap
+        return bitmap
+
+    def get_working_days_counts(self, year):
+        """
+        Return the cumulative count of working days of the given year.
+
+        The item at index ``n`` is the number of working days among the ``n``
+        first days of the year. Hence, the last item is the total number of
+        working days in this year.
+        """
+        try:
+            return self._working_days_counts[year]
+        except KeyError:
+            pass
+        bitmap = self.get_working_days_bitmap(year)
+        length = jan_1st_ordinal(year + 1) - jan_1st_ordinal(year)
+        counts = array('H', [0])
+        count = 0
+        for offset in range(length):
+            if is_bit_set(bitmap, offset):
+                count += 1
+            counts.append(count)
+        self._working_days_counts[year] = counts
+        return counts
+
     def get_weekend_days(self):
         """Return a list (or a tuple) of weekdays that are *not* working days.
 
@@ -587,24 +980,37 @@ class CoreCalendar:
         holidays, even if not in the regular calendar holidays (or weekends).
 
         Please note that the ``extra_working_days`` list has priority over the
-        ``extra_holidays`` list.
+        ``extra_holidays`` list. Both can be given as :class:`DateSet`
+        instances, to avoid cleaning them at every call.
 
         """
         day = cleaned_date(day)
-        if extra_working_days:
-            extra_working_days = tuple(map(cleaned_date, extra_working_days))
-        if extra_holidays:
-            extra_holidays = tuple(map(cleaned_date, extra_holidays))
+        extra_working_days = as_date_set(extra_working_days)
+        extra_holidays = as_date_set(extra_holidays)
 
         # Extra lists exceptions
         if extra_working_days and day in extra_working_days:
             return True
-
-        # Regular rules
-        if day.weekday() in self.get_weekend_days():
+        if type(self).is_holiday is not CoreCalendar.is_holiday:
+            # Overridden is_holiday(): the bitmap doesn't know about it
+            if day in map(cleaned_date, self.get_extra_working_days(day.year)):
+                return True
+            if day.weekday() in self.get_weekend_days():
+                return False
+            return not self.is_holiday(day, extra_holidays=extra_holidays)
+        if extra_holidays and day in extra_holidays:
             return False
 
-        return not self.is_holiday(day, extra_holidays=extra_holidays)
+        # Regular rules, already folded in the working days bitmap
+        year = day.year
+        bitmap = self._working_days_bitmaps.get(year)
+        if bitmap is None and day.weekday() in self.get_weekend_days():
+            # No need to compute the holidays of the year, unless this
+            # weekend day is a shifted working day.
+            return day in map(cleaned_date, self.get_extra_working_days(year))
+        if bitmap is None:
+            bitmap = self.get_working_days_bitmap(year)
+        return is_bit_set(bitmap, day.toordinal() - jan_1st_ordinal(year))
 
     def is_holiday(self, day, extra_holidays=None):
         """Return True if it's an holiday.
@@ -615,14 +1021,82 @@ class CoreCalendar:
 
         """
         day = cleaned_date(day)
-
-        if extra_holidays:
-            extra_holidays = tuple(map(cleaned_date, extra_holidays))
+        extra_holidays = as_date_set(extra_holidays)
 
         if extra_holidays and day in extra_holidays:
             return True
 
-        return day in self.holidays_set(day.year)
+        year = day.year
+        return is_bit_set(
+            self.get_holidays_bitmap(year),
+            day.toordinal() - jan_1st_ordinal(year)
+        )
+
+    def _overrides_working_days(self):
+        """
+        Return True if ``is_working_day()`` or ``is_holiday()`` is overridden.
+
+        The working days bitmaps don't know about these overrides: the helpers
+        built on them then check the days one by one, using these methods.
+        """
+        cls = type(self)
+        return (
+            cls.is_working_day is not CoreCalendar.is_working_day
+            or cls.is_holiday is not CoreCalendar.is_holiday
+        )
+
+    def _add_working_days_day_by_day(self, day, delta,
+                                     extra_working_days, extra_holidays):
+        step = timedelta(days=1 if delta >= 0 else -1)
+        count = 0
+        while count < abs(delta):
+            day += step
+            if self.is_working_day(
+                    day,
+                    extra_working_days=extra_working_days,
+                    extra_holidays=extra_holidays):
+                count += 1
+        return day
+
+    def _count_working_days(self, start, end):
+        """
+        Return the number of regular working days in the ]start, end]
+        interval, using the cumulative counts of the years it spans.
+        """
+        start_offset = start.toordinal() - jan_1st_ordinal(start.year)
+        end_offset = end.toordinal() - jan_1st_ordinal(end.year)
+        count = self.get_working_days_counts(end.year)[end_offset + 1]
+        count -= self.get_working_days_counts(start.year)[start_offset + 1]
+        for year in range(start.year, end.year):
+            count += self.get_working_days_counts(year)[-1]
+        return count
+
+    def _find_working_day(self, day, delta):
+        """
+        Return the ``delta``-th regular working day after the given day (or
+        before it, if ``delta`` is negative).
+
+        The target year is found using the yearly totals, then the day itself
+        is found by a binary search over the cumulative counts of this year.
+        """
+        year = day.year
+        counts = self.get_working_days_counts(year)
+        offset = day.toordinal() - jan_1st_ordinal(year)
+        if delta > 0:
+            # Rank of the target working day, counted from January 1st.
+            rank = counts[offset + 1] + delta
+            while rank > counts[-1]:
+                rank -= counts[-1]
+                year += 1
+                counts = self.get_working_days_counts(year)
+        else:
+            rank = counts[offset] + delta + 1
+            while rank <= 0:
+                year -= 1
+                counts = self.get_working_days_counts(year)
+                rank += counts[-1]
+        offset = bisect_left(counts, rank) - 1
+        return date.fromordinal(jan_1st_ordinal(year) + offset)
 
     def add_working_days(self, day, delta,
                          extra_working_days=None, extra_holidays=None,
@@ -644,27 +1118,63 @@ class CoreCalendar:
         holidays, even if not in the regular calendar holidays (or weekends).
 
         Please note that the ``extra_working_days`` list has priority over the
-        ``extra_holidays`` list.
+        ``extra_holidays`` list. Both can be given as :class:`DateSet`
+        instances, to avoid cleaning them at every call.
         """
         day = cleaned_date(day, keep_datetime)
-
-        if extra_working_days:
-            extra_working_days = tuple(map(cleaned_date, extra_working_days))
-
-        if extra_holidays:
-            extra_holidays = tuple(map(cleaned_date, extra_holidays))
-
-        days = 0
-        temp_day = day
-        day_added = 1 if delta >= 0 else -1
-        delta = abs(delta)
-        while days < delta:
-            temp_day = temp_day + timedelta(days=day_added)
-            if self.is_working_day(temp_day,
-                                   extra_working_days=extra_working_days,
-                                   extra_holidays=extra_holidays):
-                days += 1
-        return temp_day
+        if not delta:
+            return day
+        current = cleaned_date(day)
+
+        extra_working_days = as_date_set(extra_working_days)
+        extra_holidays = as_date_set(extra_holidays)
+
+        if self._overrides_working_days():
+            return self._add_working_days_day_by_day(
+                day, delta, extra_working_days, extra_holidays)
+
+        # Exceptions that may be met on the way, in the walking order.
+        forward = delta > 0
+        remaining = abs(delta)
+        extra_days = heapq.merge(
+            *(
+                extra.iter_after(current) if forward
+                else extra.iter_before(current)
+                for extra in (extra_working_days, extra_holidays) if extra
+            ),
+            reverse=not forward
+        )
+        # Target without the exceptions. Only the exceptions met before it
+        # may move it: they're applied one by one, and the target is found
+        # again from there.
+        target = self._find_working_day(
+            current, remaining if forward else -remaining)
+        for extra in extra_days:
+            if (extra > target) if forward else (extra < target):
+                break
+            if extra == current:
+                # Both in the extra working days and the extra holidays
+                continue
+            # Regular working days met before reaching this exception
+            if forward:
+                remaining -= self._count_working_days(
+                    current, extra - timedelta(days=1))
+            else:
+                remaining -= self._count_working_days(
+                    extra, current - timedelta(days=1))
+            current = extra
+            if self.is_working_day(
+                    extra,
+                    extra_working_days=extra_working_days,
+                    extra_holidays=extra_holidays):
+                remaining -= 1
+                if not remaining:
+                    target = extra
+                    break
+            target = self._find_working_day(
+                current, remaining if forward else -remaining)
+        result = target
+        return day + timedelta(days=result.toordinal() - day.toordinal())
 
     def sub_working_days(self, day, delta,
                          extra_working_days=None, extra_holidays=None,
@@ -862,22 +1372,46 @@ class CoreCalendar:
         if start > end:
             start, end = end, start
 
-        # Starting count here
-        is_working_day = self.is_working_day(
-            start,
-            extra_working_days=extra_working_days,
-            extra_holidays=extra_holidays
-        )
-        count = 1 if include_start and is_working_day else 0
-        while start < end:
-            start += timedelta(days=1)
-            is_working_day = self.is_working_day(
+        extra_working_days = as_date_set(extra_working_days)
+        extra_holidays = as_date_set(extra_holidays)
+
+        if self._overrides_working_days():
+            count = 0
+            day = start
+            if not include_start:
+                day += timedelta(days=1)
+            while day <= end:
+                if self.is_working_day(
+                        day,
+                        extra_working_days=extra_working_days,
+                        extra_holidays=extra_holidays):
+                    count += 1
+                day += timedelta(days=1)
+            return count
+
+        count = self._count_working_days(start, end)
+
+        # Exceptions that are flipping the regular days in the interval
+        if extra_working_days:
+            for day in extra_working_days.iter_after(start):
+                if day > end:
+                    break
+                if not self.is_working_day(day):
+                    count += 1
+        if extra_holidays:
+            for day in extra_holidays.iter_after(start):
+                if day > end:
+                    break
+                if extra_working_days and day in extra_working_days:
+                    continue
+                if self.is_working_day(day):
+                    count -= 1
+
+        if include_start and self.is_working_day(
                 start,
                 extra_working_days=extra_working_days,
-                extra_holidays=extra_holidays
-            )
-            if is_working_day:
-                count += 1
+                extra_holidays=extra_holidays):
+            count += 1
         return count
 
     def _get_ical_period(self, period=None):
@@ -1,6 +1,6 @@
 from datetime import date
 
-from ..core import OrthodoxCalendar, MON, daterange, cleaned_date
+from ..core import OrthodoxCalendar, MON, daterange
 from ..registry_tools import iso_register
 
 
@@ -92,13 +92,8 @@ class Russia(OrthodoxCalendar):
         holidays.extend(shifts)
         return holidays
 
-    def is_working_day(self, day,
-                       extra_working_days=None, extra_holidays=None):
-        day = cleaned_date(day)
-        if day == date(2021, 2, 20):
-            return True
-        return super().is_working_day(
-            day,
-            extra_working_days=extra_working_days,
-            extra_holidays=extra_holidays
-        )
+    def get_extra_working_days(self, year):
+        days = super().get_extra_working_days(year)
+        if year == 2021:
+            days.append(date(year, 2, 20))
+        return days
@@ -0,0 +1,63 @@
+"""
+Hebrew calendar tools
+
+From Nisan to Elul, the Hebrew months have a fixed length. Hence, the
+Gregorian date of every holiday in this part of the Hebrew year (and of the
+following Rosh Hashana) is a fixed number of days away from the 1st of Nisan.
+
+The day of the year of the 1st of Nisan is precomputed for a range of
+Gregorian years. ``pyluach`` is only needed outside of this range.
+"""
+from datetime import date
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+
+# Number of days from the January 1st to the 1st of Nisan, per Gregorian year,
+# starting at FIRST_YEAR. Use ``compute_nisan_offset()`` to extend it.
+NISAN_OFFSETS = (
+    89, 79, 97, 87, 76, 95, 85, 74, 92, 81,  # 1900
+    99, 88, 78, 97, 86, 74, 94, 82, 72, 90,  # 1910
+    79, 98, 88, 76, 95, 84, 74, 92, 81, 100,  # 1920
+    88, 77, 97, 86, 75, 93, 83, 71, 91, 79,  # 1930
+    99, 87, 77, 95, 84, 73, 91, 80, 100, 89,  # 1940
+    77, 96, 86, 75, 93, 82, 72, 91, 80, 98,  # 1950
+    88, 76, 94, 84, 73, 92, 80, 100, 89, 78,  # 1960
+    96, 85, 75, 92, 82, 71, 91, 78, 97, 87,  # 1970
+    77, 94, 83, 73, 93, 81, 99, 89, 78, 95,  # 1980
+    85, 74, 94, 81, 71, 90, 80, 97, 86, 76,  # 1990
+    96, 83, 72, 92, 82, 99, 88, 78, 96, 84,  # 2000
+    74, 94, 83, 70, 90, 79, 99, 86, 75, 95,  # 2010
+    85, 72, 91, 81, 99, 88, 77, 97, 87, 75,  # 2020
+    93, 83, 72, 89, 79, 99, 88, 75, 95, 84,  # 2030
+    74, 91, 80, 100, 88, 77, 96, 86, 74, 92,  # 2040
+    82, 72, 90, 78, 98, 88, 77, 94, 84, 73,  # 2050
+    91, 80, 100, 89, 77, 96, 85, 75, 93, 81,  # 2060
+    71, 89, 79, 97, 87, 75, 94, 83, 73, 91,  # 2070
+    80, 99, 89, 78, 96, 85, 74, 92, 82, 70,  # 2080
+    90, 78, 98, 86, 76, 94, 83, 72, 92, 80,  # 2090
+    99,  # 2100
+)
+
+# Days between the 1st of Nisan and the 1st of Tishrei (next Rosh Hashana)
+TISHREI_OFFSET = 177
+
+
+def compute_nisan_offset(year):
+    """
+    Compute the number of days from the January 1st to the 1st of Nisan of
+    the given Gregorian year, using ``pyluach``.
+    """
+    from pyluach.dates import GregorianDate, HebrewDate
+    jewish_year = GregorianDate(year=year, month=1, day=1).to_heb().year
+    nisan = HebrewDate(jewish_year, 1, 1).to_pydate()
+    return nisan.toordinal() - date(year, 1, 1).toordinal()
+
+
+def get_nisan_first(year):
+    "Return the Gregorian date of the 1st of Nisan of the Gregorian year"
+    if FIRST_YEAR <= year <= LAST_YEAR:
+        offset = NISAN_OFFSETS[year - FIRST_YEAR]
+    else:
+        offset = compute_nisan_offset(year)
+    return date.fromordinal(date(year, 1, 1).toordinal() + offset)
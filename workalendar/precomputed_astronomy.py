@@ -2,11 +2,26 @@
 Astronomical functions
 
 Computed years spread from 30 years before and after the release year.
+
+The pre-computed values are stored in a compact binary file, memory-mapped
+and read in place. Its layout is:
+
+* a header: magic number, format version, first year, number of years and
+  number of time zones,
+* the time zone names, each of them prefixed by its length,
+* a table of little-endian int16 values, indexed by time zone, year and
+  term. Each year has ``TERMS_PER_YEAR`` terms: the vernal and autumn
+  equinoxes, followed by the solar terms from 15 to 345 degrees. The values
+  are day offsets from the January 1st of their year.
 """
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
 import datetime
-import gzip
+from functools import lru_cache
 import json
+import mmap
 import pathlib
+import struct
 from typing import Tuple
 
 TZAwareDate = datetime.date
@@ -19,64 +34,239 @@ TIME_ZONES = (
     'Asia/Taipei',
     'Asia/Tokyo',
 )
-pre_computed_equinoxes_path = \
-    pathlib.Path(__file__).parent / 'equinoxes.json.gz'
-pre_computed_solar_terms_path = \
-    pathlib.Path(__file__).parent / 'solar_terms.json.gz'
-
-try:
-    # Before Python 3.7, date.fromisoformat does not exist
-    datetime.date.fromisoformat
-
-    def fromisoformat(iso):
-        return datetime.date.fromisoformat(iso)
-except AttributeError:  # pre-3.7
-    def fromisoformat(iso):
-        try:
-            if not iso or '-' not in iso:
-                raise ValueError
-            parts = [int(x) for x in iso.split('-')]
-            if len(parts) != 3:
-                raise ValueError
-            return datetime.date(year=parts[0], month=parts[1], day=parts[2])
-        except ValueError:
-            raise ValueError(f"Invalid isoformat string: '{iso}'")
-
-
-def create_astronomical_data(progress=None):
-    from .skyfield_astronomy import (
-        calculate_equinoxes as real_calculate_equinoxes
-    )
-    from .skyfield_astronomy import (
-        solar_term as real_solar_term
+pre_computed_astronomy_path = \
+    pathlib.Path(__file__).parent / 'astronomy.bin'
+
+MAGIC = b'WKAS'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sBxHHH')
+VALUE = struct.Struct('<h')
+# Marks a value that hasn't been computed
+MISSING = -0x8000
+SOLAR_TERMS_DEGREES = tuple(range(15, 360, 15))
+TERMS_PER_YEAR = 2 + len(SOLAR_TERMS_DEGREES)
+
+
+class AstronomicalData:
+    """
+    Read-only view over the pre-computed astronomical data binary format.
+
+    The values are read from the buffer when requested, nothing is decoded
+    in advance.
+    """
+
+    def __init__(self, buffer):
+        magic, version, first_year, year_count, tz_count = \
+            HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Unsupported astronomical data format")
+        self.buffer = buffer
+        self.first_year = first_year
+        self.year_count = year_count
+        self.time_zones = {}
+        offset = HEADER.size
+        for index in range(tz_count):
+            length = buffer[offset]
+            name = bytes(buffer[offset + 1:offset + 1 + length])
+            self.time_zones[name.decode('utf-8')] = index
+            offset += 1 + length
+        self.data_offset = offset
+
+    def get(self, timezone, year, term):
+        """
+        Return the ordinal of the given term, or None if not pre-computed.
+
+        ``term`` is 0 for the vernal equinox, 1 for the autumn equinox, and
+        ``2 + i`` for the ``i``-th item of ``SOLAR_TERMS_DEGREES``.
+        """
+        tz_index = self.time_zones.get(timezone)
+        year_index = year - self.first_year
+        if tz_index is None or not 0 <= year_index < self.year_count:
+            return None
+        index = (tz_index * self.year_count + year_index) * TERMS_PER_YEAR
+        value, = VALUE.unpack_from(
+            self.buffer, self.data_offset + VALUE.size * (index + term))
+        if value == MISSING:
+            return None
+        return datetime.date(year, 1, 1).toordinal() + value
+
+
+def pack_astronomical_data(years, equinoxes, solar_terms):
+    """
+    Return the binary representation of the given astronomical data.
+
+    ``equinoxes`` is a dict of {timezone: {year: (vernal, autumn)}} and
+    ``solar_terms`` is a dict of {timezone: {year: {degrees: date}}}.
+    Missing values are stored as such.
+    """
+    time_zones = sorted(set(equinoxes) | set(solar_terms))
+    chunks = [HEADER.pack(
+        MAGIC, FORMAT_VERSION, years[0], len(years), len(time_zones)
+    )]
+    for timezone in time_zones:
+        name = timezone.encode('utf-8')
+        chunks.append(bytes([len(name)]) + name)
+    values = []
+    for timezone in time_zones:
+        for year in years:
+            jan_first = datetime.date(year, 1, 1)
+            terms = list(equinoxes.get(timezone, {}).get(year, (None, None)))
+            year_terms = solar_terms.get(timezone, {}).get(year, {})
+            terms.extend(
+                year_terms.get(degrees) for degrees in SOLAR_TERMS_DEGREES
+            )
+            values.extend(
+                MISSING if day is None else (day - jan_first).days
+                for day in terms
+            )
+    chunks.append(struct.pack(f'<{len(values)}h', *values))
+    return b''.join(chunks)
+
+
+def compute_astronomical_unit(time_zone, year):
+    """
+    Compute the equinoxes and the solar terms of a time zone and year.
+
+    Return a 2-tuple: (vernal, autumn) equinoxes and {degrees: date}.
+    """
+    from .skyfield_astronomy import calculate_equinoxes, solar_terms
+    return (
+        calculate_equinoxes(year, time_zone),
+        solar_terms(year, year, time_zone)[year],
     )
+
+
+def read_checkpoint(path):
+    """
+    Return the units stored in a checkpoint file, as a dict of
+    {(time_zone, year): (equinoxes, solar_terms)}.
+
+    The checkpoint file has one JSON line per computed unit. A line that
+    can't be decoded (e.g. the run was interrupted while writing it) is
+    ignored, its unit will be computed again.
+    """
+    units = {}
+    if path is None or not path.exists():
+        return units
+    with path.open(encoding='utf-8') as f:
+        for line in f:
+            try:
+                unit = json.loads(line)
+                units[unit['timezone'], unit['year']] = (
+                    tuple(
+                        datetime.date.fromisoformat(equinox)
+                        for equinox in unit['equinoxes']
+                    ),
+                    {
+                        int(degrees): datetime.date.fromisoformat(day)
+                        for degrees, day in unit['solar_terms'].items()
+                    },
+                )
+            except (ValueError, KeyError, TypeError):
+                continue
+    return units
+
+
+def write_checkpoint(f, time_zone, year, equinoxes, solar_terms):
+    """
+    Append a computed unit to the checkpoint file ``f``.
+    """
+    f.write(json.dumps({
+        'timezone': time_zone,
+        'year': year,
+        'equinoxes': [equinox.isoformat() for equinox in equinoxes],
+        'solar_terms': {
+            degrees: day.isoformat() for degrees, day in solar_terms.items()
+        },
+    }) + '\n')
+    f.flush()
+
+
+def create_astronomical_data(progress=None, first_year=None, last_year=None,
+                             time_zones=None, workers=None, checkpoint=None):
+    """
+    Compute the astronomical data and write the pre-computed data file.
+
+    The work is split in (time zone, year) units, computed by a pool of
+    ``workers`` processes (by default, one per CPU). With ``workers=1``, the
+    units are computed in the current process.
+
+    If a ``checkpoint`` path is given, every computed unit is appended to it,
+    and the units it already contains aren't computed again. This way, an
+    interrupted run can be resumed, and adding a time zone only computes the
+    new one.
+    """
     if progress is None:
-        progress = lambda it: it  # noqa: E731
+        progress = lambda it, total=None: it  # noqa: E731
     current_year = datetime.date.today().year
-    first_year = current_year - YEAR_INTERVAL
-    last_year = current_year + YEAR_INTERVAL
+    if first_year is None:
+        first_year = current_year - YEAR_INTERVAL
+    if last_year is None:
+        last_year = current_year + YEAR_INTERVAL
+    if time_zones is None:
+        time_zones = TIME_ZONES
+    if checkpoint is not None:
+        checkpoint = pathlib.Path(checkpoint)
     years = range(first_year, last_year + 1)
-    equinoxes = dict()
-    solar_terms = dict()
-    for i, time_zone in enumerate(TIME_ZONES, 1):
-        print(f"{time_zone} {i}/{len(TIME_ZONES)}")
-        equinoxes[time_zone] = dict()
-        equinoxes_tz = equinoxes[time_zone]
-        solar_terms[time_zone] = dict()
-        solar_terms_tz = solar_terms[time_zone]
-        for year in progress(years):
-            equinoxes_tz[year] = tuple(
-                equinox.isoformat()
-                for equinox in real_calculate_equinoxes(year, time_zone)
+    units = [(time_zone, year) for time_zone in time_zones for year in years]
+    done = read_checkpoint(checkpoint)
+    pending = [unit for unit in units if unit not in done]
+    print(f"{len(pending)}/{len(units)} units to compute")
+
+    with ExitStack() as stack:
+        checkpoint_file = None
+        if checkpoint is not None:
+            checkpoint_file = stack.enter_context(
+                checkpoint.open('a', encoding='utf-8')
+            )
+            if checkpoint_file.tell():
+                # The last line may have been interrupted: start a new one,
+                # blank lines are ignored.
+                checkpoint_file.write('\n')
+        if workers == 1:
+            results = (
+                (unit, compute_astronomical_unit(*unit)) for unit in pending
+            )
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            futures = {
+                executor.submit(compute_astronomical_unit, *unit): unit
+                for unit in pending
+            }
+
+            def shutdown():
+                # Don't wait for the queued units when interrupted
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
+            stack.callback(shutdown)
+            results = (
+                (futures[future], future.result())
+                for future in as_completed(futures)
             )
-            solar_terms_tz[year] = dict()
-            for degrees in range(15, 360, 15):
-                solar_terms_tz[year][degrees] = \
-                    real_solar_term(year, degrees, time_zone).isoformat()
-    with gzip.open(pre_computed_equinoxes_path, 'wb') as f:
-        f.write(json.dumps(equinoxes, ensure_ascii=False).encode('utf-8'))
-    with gzip.open(pre_computed_solar_terms_path, 'wb') as f:
-        f.write(json.dumps(solar_terms, ensure_ascii=False).encode('utf-8'))
+        for unit, result in progress(results, total=len(pending)):
+            done[unit] = result
+            if checkpoint_file is not None:
+                write_checkpoint(checkpoint_file, *unit, *result)
+
+    equinoxes = {time_zone: {} for time_zone in time_zones}
+    solar_terms = {time_zone: {} for time_zone in time_zones}
+    for time_zone, year in units:
+        equinoxes[time_zone][year], solar_terms[time_zone][year] = \
+            done[time_zone, year]
+    pre_computed_astronomy_path.write_bytes(
+        pack_astronomical_data(years, equinoxes, solar_terms)
+    )
+
+
+@lru_cache(maxsize=None)
+def load_astronomical_data() -> AstronomicalData:
+    """
+    Memory-map the pre-computed astronomical data, once per process.
+    """
+    with pre_computed_astronomy_path.open('rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return AstronomicalData(buffer)
 
 
 def calculate_equinoxes(
@@ -87,16 +277,13 @@ def calculate_equinoxes(
     calculate equinox with time zone.
     returns a 2-tuple with vernal and autumn equinoxes.
     """
-    equinoxes = json.loads(gzip.decompress(
-        pre_computed_equinoxes_path.read_bytes()
-    ).decode('utf-8'))
-    try:
-        result = equinoxes[timezone][str(year)]
-    except KeyError:
+    data = load_astronomical_data()
+    result = (data.get(timezone, year, 0), data.get(timezone, year, 1))
+    if None in result:
         raise NotImplementedError(
             f"The year {year} and timezone {timezone} are not pre-computed"
         )
-    return tuple(fromisoformat(equinox) for equinox in result)
+    return tuple(datetime.date.fromordinal(equinox) for equinox in result)
 
 
 def solar_term(year: int, degrees: int, timezone: str = 'UTC') -> TZAwareDate:
@@ -104,15 +291,11 @@ def solar_term(year: int, degrees: int, timezone: str = 'UTC') -> TZAwareDate:
         raise ValueError(
             "The degrees should be between 15 and 345 by step of 15"
         )
-    solar_terms = json.loads(gzip.decompress(
-        pre_computed_solar_terms_path.read_bytes()
-    ).decode('utf-8'))
-    try:
-        solar_terms_per_tz_and_year = solar_terms[timezone][str(year)]
-    except KeyError:
+    result = load_astronomical_data().get(
+        timezone, year, 2 + SOLAR_TERMS_DEGREES.index(degrees)
+    )
+    if result is None:
         raise NotImplementedError(
             f"The year {year} and timezone {timezone} are not pre-computed"
         )
-    return fromisoformat(
-        solar_terms_per_tz_and_year[str(degrees)]
-    )
+    return datetime.date.fromordinal(result)
@@ -1,8 +1,34 @@
+from collections import namedtuple
 from importlib import import_module
+import json
+import pathlib
+import threading
+from types import MappingProxyType
 
 from .core import Calendar
 from .exceptions import ISORegistryError
 
+registry_manifest_path = pathlib.Path(__file__).parent / 'registry.json'
+
+#: Standard calendar, as described in the registry manifest
+ManifestEntry = namedtuple('ManifestEntry', ('module', 'class_name', 'name'))
+
+
+def load_registry_manifest():
+    """
+    Return the registry manifest: the standard calendars, as a dict of
+    {iso_code: ManifestEntry}.
+
+    The manifest is generated by the ``create-registry-manifest`` script.
+    """
+    manifest = json.loads(registry_manifest_path.read_text(encoding='utf-8'))
+    return {
+        iso_code: ManifestEntry(
+            entry['module'], entry['class'], entry['name']
+        )
+        for iso_code, entry in manifest.items()
+    }
+
 
 class IsoRegistry:
     """
@@ -29,12 +55,59 @@ class IsoRegistry:
     )
 
     def __init__(self, load_standard_modules=True):
-        self.region_registry = dict()
+        # Standard calendars are described by their manifest entry, until
+        # their class is needed.
+        self._region_registry = dict()
+        # Subregions codes, by parent code. Values are dicts used as ordered
+        # sets.
+        self._subregions = dict()
+        # Calendar instances, by ISO code and constructor arguments
+        self._instances = dict()
+        self._instances_lock = threading.Lock()
         if load_standard_modules:
-            for module_name in self.STANDARD_MODULES:
-                module = f'workalendar.{module_name}'
-                all_classes = getattr(import_module(module), '__all__')
-                self.load_module_from_items(module, all_classes)
+            prefixes = tuple(
+                f'workalendar.{module_name}'
+                for module_name in self.STANDARD_MODULES
+            )
+            for iso_code, entry in load_registry_manifest().items():
+                # Only the calendars of the STANDARD_MODULES packages
+                if any(
+                    entry.module == prefix
+                    or entry.module.startswith(f'{prefix}.')
+                    for prefix in prefixes
+                ):
+                    self._add(iso_code, entry)
+
+    @property
+    def region_registry(self):
+        """
+        Read-only mapping of all the registered calendar classes, by ISO code.
+
+        Calendars are registered using :meth:`register`, or by assigning a
+        whole dict to this property.
+        """
+        for iso_code in self._region_registry:
+            self._get_class(iso_code)
+        return MappingProxyType(self._region_registry)
+
+    @region_registry.setter
+    def region_registry(self, value):
+        registry = IsoRegistry(load_standard_modules=False)
+        for iso_code, cls in value.items():
+            registry.register(iso_code, cls)
+        self._region_registry = registry._region_registry
+        self._subregions = registry._subregions
+        self.clear_instances()
+
+    def _get_class(self, iso_code):
+        """
+        Return the calendar class of ``iso_code``, imported if needed.
+        """
+        value = self._region_registry[iso_code]
+        if isinstance(value, ManifestEntry):
+            value = getattr(import_module(value.module), value.class_name)
+            self._region_registry[iso_code] = value
+        return value
 
     def register(self, iso_code, cls):
         """
@@ -44,7 +117,21 @@ class IsoRegistry:
             raise ISORegistryError(
                 f"Class `{cls}` is not a Calendar class"
             )
-        self.region_registry[iso_code] = cls
+        self._add(iso_code, cls)
+        # Pooled instances of the previous class are outdated
+        with self._instances_lock:
+            for key in [key for key in self._instances if key[0] == iso_code]:
+                del self._instances[key]
+
+    def _add(self, iso_code, value):
+        if iso_code not in self._region_registry:
+            # Index the code under each of its parents: "A-B-C" is a
+            # subregion of "A" and of "A-B".
+            parts = iso_code.split('-')
+            for index in range(1, len(parts)):
+                parent = '-'.join(parts[:index])
+                self._subregions.setdefault(parent, {})[iso_code] = None
+        self._region_registry[iso_code] = value
 
     def load_module_from_items(self, module_name, items):
         """
@@ -69,7 +156,54 @@ class IsoRegistry:
 
         :rtype: Calendar
         """
-        return self.region_registry.get(iso_code)
+        if iso_code not in self._region_registry:
+            return None
+        return self._get_class(iso_code)
+
+    def get_instance(self, iso_code, prewarm_years=None, **kwargs):
+        """
+        Retrieve a calendar instance for the given ``iso_code``, built with
+        the ``kwargs`` constructor arguments.
+
+        Instances are pooled by ISO code and constructor arguments: the same
+        instance, and its holidays cache, is returned for the same arguments.
+        ``prewarm_years`` is an optional iterable of years whose holidays and
+        working days are computed in advance.
+
+        Returns None if no calendar is registered for this ``iso_code``.
+
+        >>> calendar = registry.get_instance(
+        ...     'NL', prewarm_years=range(2020, 2031), include_carnival=True)
+
+        :rtype: Calendar
+        """
+        cls = self.get(iso_code)
+        if cls is None:
+            return None
+        key = (iso_code, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments: can't be pooled
+            calendar = cls(**kwargs)
+        else:
+            with self._instances_lock:
+                calendar = self._instances.get(key)
+                if calendar is None:
+                    calendar = self._instances[key] = cls(**kwargs)
+        for year in prewarm_years or ():
+            calendar.get_working_days_counts(year)
+        return calendar
+
+    def clear_instances(self):
+        """
+        Empty the calendar instances pool.
+        """
+        with self._instances_lock:
+            self._instances.clear()
+
+    def _get_subregion_codes(self, iso_code):
+        return list(self._subregions.get(iso_code, ()))
 
     def get_subregions(self, iso_code):
         """
@@ -84,11 +218,30 @@ class IsoRegistry:
         :return dict where keys are ISO codes strings
         and values are calendar classes
         """
-        items = dict()
-        for key, value in self.region_registry.items():
-            if key.startswith(f"{iso_code}-"):
-                items[key] = value
-        return items
+        return {
+            key: self._get_class(key)
+            for key in self._get_subregion_codes(iso_code)
+        }
+
+    def _get_codes(self, region_codes=None, include_subregions=False):
+        """
+        Return the registered ISO codes matching the ``get_calendars()``
+        arguments.
+        """
+        if not region_codes:
+            # Here it contains all subregions
+            if include_subregions:
+                return list(self._region_registry)
+            return [key for key in self._region_registry if '-' not in key]
+
+        codes = []
+        for code in region_codes:
+            if code not in self._region_registry:
+                continue
+            codes.append(code)
+            if include_subregions:
+                codes.extend(self._get_subregion_codes(code))
+        return codes
 
     def get_calendars(self, region_codes=None, include_subregions=False):
         """
@@ -103,23 +256,27 @@ class IsoRegistry:
         :return dict where keys are ISO codes strings
         and values are calendar classes
         """
-        if not region_codes:
-            # Here it contains all subregions
-            if include_subregions:
-                return self.region_registry.copy()
-            items = {k: v for k, v in self.region_registry.items()
-                     if '-' not in k}
-            return items
+        return {
+            code: self._get_class(code)
+            for code in self._get_codes(region_codes, include_subregions)
+        }
 
-        items = dict()
-        for code in region_codes:
-            try:
-                items[code] = self.region_registry[code]
-            except KeyError:
-                continue
-            if include_subregions:
-                items.update(self.get_subregions(code))
-        return items
+    def get_names(self, region_codes=None, include_subregions=False):
+        """
+        Returns calendar names for regions.
+
+        Same as ``get_calendars()``, but the values are the calendar names.
+        Standard calendars names are read from the registry manifest: it
+        doesn't import their module.
+
+        :rtype dict
+        :return dict where keys are ISO codes strings
+        and values are calendar names
+        """
+        return {
+            code: self._region_registry[code].name
+            for code in self._get_codes(region_codes, include_subregions)
+        }
 
 
 registry = IsoRegistry()
@@ -22,3 +22,41 @@ def iso_register(iso_code):
         cls.__iso_code = (iso_code, cls.__name__)
         return cls
     return wrapper
+
+
+def build_registry_manifest():
+    """
+    Return the registry manifest of the standard modules calendars, as a
+    dict of {iso_code: {'module': ..., 'class': ..., 'name': ...}}.
+
+    It imports all the standard modules.
+    """
+    from importlib import import_module
+    from .registry import IsoRegistry
+
+    registry = IsoRegistry(load_standard_modules=False)
+    for module_name in IsoRegistry.STANDARD_MODULES:
+        module = f'workalendar.{module_name}'
+        all_classes = getattr(import_module(module), '__all__')
+        registry.load_module_from_items(module, all_classes)
+    return {
+        iso_code: {
+            'module': cls.__module__,
+            'class': cls.__name__,
+            'name': cls.name,
+        }
+        for iso_code, cls in registry.region_registry.items()
+    }
+
+
+def create_registry_manifest():
+    """
+    Write the registry manifest file, shipped with the package.
+    """
+    import json
+    from .registry import registry_manifest_path
+
+    manifest = json.dumps(
+        build_registry_manifest(), indent=2, ensure_ascii=False
+    )
+    registry_manifest_path.write_text(manifest + '\n', encoding='utf-8')
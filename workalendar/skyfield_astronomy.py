@@ -1,17 +1,26 @@
 """
 Astronomical functions
 """
+from functools import lru_cache
 from math import pi, radians, tau
+import sys
+import threading
 try:
     # As of Python 3.9, included in the stdlib
     from zoneinfo import ZoneInfo
 except ImportError:  # pre-3.9
     from backports.zoneinfo import ZoneInfo
+import skyfield
 from skyfield.api import Loader
 from skyfield import almanac
+from skyfield.nutationlib import iau2000b_radians
 from skyfield_data import get_skyfield_data_path
 from datetime import date, timedelta
 
+if sys.version_info[:2] < (3, 8):  # coverage: exclude
+    import importlib_metadata
+else:  # coverage: exclude
+    import importlib.metadata as importlib_metadata
 
 # Parameter for the newton method to converge towards the closest solution
 # to the function. By default it'll be an approximation of a 10th of a second.
@@ -20,14 +29,63 @@ minute = hour / 60
 second = minute / 60
 newton_precision = second / 10
 
+# Planets ephemeris file, provided by skyfield-data
+EPHEMERIS = 'de421.bsp'
+
+
+@lru_cache(maxsize=None)
+def get_version():
+    """
+    Return the version of the Skyfield, skyfield-data and ephemeris used for
+    the computations. Cached results are only valid for this version.
+    """
+    return (
+        f"skyfield {skyfield.__version__},"
+        f" skyfield-data {importlib_metadata.version('skyfield-data')},"
+        f" {EPHEMERIS}"
+    )
+
+
+class EphemerisSession:
+    """
+    Skyfield loader, timescale and planets ephemeris.
+
+    Loading the ephemeris is by far the most expensive part of the
+    astronomical computations, so a single session is shared by all of them
+    (see :func:`get_session`).
+    """
+
+    def __init__(self):
+        self.load = Loader(get_skyfield_data_path())
+        self.ts = self.load.timescale()
+        self.planets = self.load(EPHEMERIS)
+        self.earth = self.planets['earth']
+        self.sun = self.planets['sun']
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the process-wide ephemeris session, loaded on first use.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = EphemerisSession()
+    return _session
+
 
 def calculate_equinoxes(year, timezone='UTC'):
     """ calculate equinox with time zone """
     tz = ZoneInfo(timezone)
 
-    load = Loader(get_skyfield_data_path())
-    ts = load.timescale()
-    planets = load('de421.bsp')
+    session = get_session()
+    ts = session.ts
+    planets = session.planets
 
     t0 = ts.utc(year, 1, 1)
     t1 = ts.utc(year, 12, 31)
@@ -97,11 +155,10 @@ def solar_term(year, degrees, timezone='UTC'):
     # Target angle as radians
     target_angle = radians(degrees)
 
-    load = Loader(get_skyfield_data_path())
-    planets = load('de421.bsp')
-    earth = planets['earth']
-    sun = planets['sun']
-    ts = load.timescale()
+    session = get_session()
+    earth = session.earth
+    sun = session.sun
+    ts = session.ts
     tz = ZoneInfo(timezone)
 
     jan_first = ts.utc(date(year, 1, 1))
@@ -140,3 +197,43 @@ def solar_term(year, degrees, timezone='UTC'):
     # Convert in the timezone
     result = t.astimezone(tz)
     return result.date()
+
+
+def solar_terms(first_year, last_year=None, timezone='UTC'):
+    """
+    Return all the solar terms of a range of years, in a single pass.
+
+    The result is a dict of {year: {degrees: date}}, with degrees from 0
+    (vernal equinox) to 345, by step of 15.
+
+    Instead of solving every term one by one (see :func:`solar_term`), the
+    Sun longitude is evaluated on an array of times spread over the whole
+    range, and the 15 degrees sectors changes are refined by Skyfield's
+    ``find_discrete``.
+    """
+    if last_year is None:
+        last_year = first_year
+    session = get_session()
+    ts = session.ts
+    earth = session.earth
+    sun = session.sun
+    tz = ZoneInfo(timezone)
+
+    def sector(t):
+        # Truncated nutation model, as used by Skyfield's own almanac
+        # functions: much faster, and precise enough for dates.
+        t._nutation_angles_radians = iau2000b_radians(t)
+        astrometric = earth.at(t).observe(sun)
+        latitude, longitude, _ = astrometric.ecliptic_latlon(epoch='date')
+        return (longitude.degrees // 15).astype(int) % 24
+
+    # Solar terms are about 15 days apart
+    sector.step_days = 7
+
+    t0 = ts.utc(first_year, 1, 1)
+    t1 = ts.utc(last_year + 1, 1, 1)
+    times, sectors = almanac.find_discrete(t0, t1, sector)
+    result = {year: {} for year in range(first_year, last_year + 1)}
+    for t, index in zip(times.utc_datetime(), sectors):
+        result[t.year][int(index) * 15] = t.astimezone(tz).date()
+    return result
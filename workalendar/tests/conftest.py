@@ -0,0 +1,15 @@
+import pytest
+
+from ..cache import astronomy_cache
+
+
+@pytest.fixture(autouse=True, scope='session')
+def no_astronomy_cache():
+    """
+    Don't use the user astronomy cache: the tests compute the astronomical
+    results of the current code, and don't write in the user directory.
+    """
+    auto_enable = astronomy_cache.auto_enable
+    astronomy_cache.disable()
+    yield
+    astronomy_cache.auto_enable = auto_enable
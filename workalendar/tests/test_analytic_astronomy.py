@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+import importlib
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from .. import analytic_astronomy, astronomy, precomputed_astronomy
+from ..analytic_astronomy import calculate_equinoxes, delta_t, solar_term
+
+
+def test_calculate_some_equinoxes():
+    assert calculate_equinoxes(2010) == (date(2010, 3, 20), date(2010, 9, 23))
+    assert calculate_equinoxes(2010, 'Asia/Taipei') == (
+        date(2010, 3, 21), date(2010, 9, 23)
+    )
+    assert calculate_equinoxes(2013) == (date(2013, 3, 20), date(2013, 9, 22))
+    assert calculate_equinoxes(2014) == (date(2014, 3, 20), date(2014, 9, 23))
+    assert calculate_equinoxes(2020) == (date(2020, 3, 20), date(2020, 9, 22))
+
+
+def test_calculate_equinoxes_any_year():
+    # Out of the Meeus' equinoxes polynomials range
+    assert calculate_equinoxes(500) == (date(500, 3, 20), date(500, 9, 23))
+    assert calculate_equinoxes(3500) == (
+        date(3500, 3, 20), date(3500, 9, 22)
+    )
+
+
+def test_qingming_festivals():
+    assert solar_term(2001, 15) == date(2001, 4, 4)
+    assert solar_term(2001, 15, 'Asia/Taipei') == date(2001, 4, 5)
+    assert solar_term(2011, 15) == date(2011, 4, 5)
+    assert solar_term(2014, 15) == date(2014, 4, 4)
+    assert solar_term(2016, 15) == date(2016, 4, 4)
+    assert solar_term(2017, 15) == date(2017, 4, 4)
+
+
+def test_qingming_festivals_hk():
+    assert solar_term(2018, 15, 'Asia/Hong_Kong') == date(2018, 4, 5)
+    assert solar_term(2019, 15, 'Asia/Hong_Kong') == date(2019, 4, 5)
+    assert solar_term(2020, 15, 'Asia/Hong_Kong') == date(2020, 4, 4)
+    assert solar_term(2021, 15, 'Asia/Hong_Kong') == date(2021, 4, 4)
+
+
+@pytest.mark.parametrize('year, expected', [
+    (1850, 7.1),
+    (1900, -2.8),
+    (1950, 29.1),
+    (2000, 63.9),
+    (2010, 66.7),
+])
+def test_delta_t(year, expected):
+    assert delta_t(year) == pytest.approx(expected, abs=.1)
+
+
+@pytest.mark.parametrize('timezone', precomputed_astronomy.TIME_ZONES)
+def test_match_precomputed(timezone):
+    """
+    The analytic functions match the pre-computed (Skyfield) data, apart from
+    a few solar terms close to midnight. The analytic solar terms are biased
+    early: these ones are one day early.
+    """
+    mismatches = 0
+    for year in range(1991, 2052):
+        assert analytic_astronomy.calculate_equinoxes(year, timezone) == \
+            precomputed_astronomy.calculate_equinoxes(year, timezone)
+        for degrees in range(15, 345, 15):
+            result = analytic_astronomy.solar_term(year, degrees, timezone)
+            expected = precomputed_astronomy.solar_term(
+                year, degrees, timezone
+            )
+            if result != expected:
+                assert result == expected - timedelta(days=1)
+                mismatches += 1
+    assert mismatches <= 5
+
+
+def test_astronomy_fallback():
+    """
+    Without Skyfield, the analytic functions are used out of the pre-computed
+    years and time zones.
+    """
+    try:
+        with patch.dict(sys.modules, {'skyfield': None}):
+            module = importlib.reload(astronomy)
+        with patch.object(analytic_astronomy, 'calculate_equinoxes') as eq, \
+                patch.object(analytic_astronomy, 'solar_term') as term:
+            assert module.calculate_equinoxes(2020, 'Asia/Tokyo') == (
+                date(2020, 3, 20), date(2020, 9, 22)
+            )
+            assert module.solar_term(2020, 15, 'Asia/Hong_Kong') == \
+                date(2020, 4, 4)
+            eq.assert_not_called()
+            term.assert_not_called()
+        assert module.calculate_equinoxes(2100, 'Asia/Tokyo') == (
+            date(2100, 3, 20), date(2100, 9, 23)
+        )
+        assert module.solar_term(2100, 15, 'Asia/Hong_Kong') == \
+            date(2100, 4, 5)
+    finally:
+        importlib.reload(astronomy)
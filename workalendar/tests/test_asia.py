@@ -8,7 +8,7 @@ from ..asia import (
     Japan, JapanBank, Qatar, Singapore,
     SouthKorea, Taiwan, Malaysia, China, Israel, Philippines, Kazakhstan
 )
-from ..asia.china import holidays as china_holidays
+from ..asia.china import holidays as china_holidays, workdays
 from ..exceptions import CalendarError
 
 
@@ -171,6 +171,32 @@ class ChinaTest(GenericCalendarTest):
             date(2019, 2, 3)
         )
 
+    def test_extra_working_days_attribute(self):
+        self.assertIn(date(2019, 2, 2), self.cal.extra_working_days)
+        self.assertIn(date(2023, 10, 8), self.cal.extra_working_days)
+        self.assertEqual(
+            len(self.cal.extra_working_days),
+            sum(len(days) for data in workdays.values()
+                for days in data.values())
+        )
+
+    def test_weekend_unconfigured_year(self):
+        # A SUN of a year that isn't configured
+        self.assertFalse(self.cal.is_working_day(date(2017, 3, 5)))
+        with self.assertRaises(CalendarError):
+            self.cal.is_working_day(date(2017, 3, 6))
+
+    def test_extra_days(self):
+        # It's a SUN, but it's a working day this year
+        day = date(2021, 4, 25)
+        # User extra holidays take precedence over the shifted working days
+        self.assertFalse(self.cal.is_working_day(day, extra_holidays=[day]))
+        # User extra working days are added to the shifted working days
+        self.assertTrue(self.cal.is_working_day(
+            day, extra_working_days=[date(2021, 5, 2)]))
+        self.assertTrue(self.cal.is_working_day(
+            date(2021, 5, 2), extra_working_days=[date(2021, 5, 2)]))
+
 
 class HongKongTest(GenericCalendarTest):
 
@@ -836,6 +862,17 @@ class IsraelTest(GenericCalendarTest):
         israel_time = time.time() - timer
         self.assertGreater(japan_time * 3, israel_time)
 
+    def test_hebrew_independence_day(self):
+        with self.assertWarns(DeprecationWarning):
+            days = self.cal.get_hebrew_independence_day(5781)
+        self.assertEqual(
+            [(day.year, day.month, day.day, label) for day, label in days],
+            [
+                (5781, 2, 2, "Independence Day Eve"),
+                (5781, 2, 3, "Independence Day"),
+            ]
+        )
+
 
 class Philippines(GenericCalendarTest):
 
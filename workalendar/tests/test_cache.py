@@ -0,0 +1,254 @@
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from ..cache import (
+    AstronomyCache, LRUCache, SharedCache, PersistentCache, user_cache_dir
+)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class LRUCacheTest(TestCase):
+
+    def test_unbounded(self):
+        cache = LRUCache()
+        for year in range(1900, 2100):
+            cache[year] = year
+        self.assertEqual(len(cache), 200)
+        self.assertEqual(cache[1900], 1900)
+
+    def test_max_years(self):
+        cache = LRUCache(max_years=2)
+        cache[2020] = 'a'
+        cache[2021] = 'b'
+        # Access 2020 to make it the most recently used
+        self.assertEqual(cache[2020], 'a')
+        cache[2022] = 'c'
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(2021, cache)
+        self.assertIn(2020, cache)
+        self.assertIn(2022, cache)
+
+    def test_max_years_incorrect(self):
+        with self.assertRaises(ValueError):
+            LRUCache(max_years=0)
+
+    def test_ttl(self):
+        timer = FakeTimer()
+        cache = LRUCache(ttl=10, timer=timer)
+        cache[2020] = 'a'
+        timer.now = 9
+        self.assertEqual(cache[2020], 'a')
+        timer.now = 10
+        self.assertNotIn(2020, cache)
+        with self.assertRaises(KeyError):
+            cache[2020]
+        self.assertEqual(len(cache), 0)
+
+    def test_mapping_api(self):
+        cache = LRUCache(max_years=10)
+        cache[2020] = 'a'
+        cache[2021] = 'b'
+        self.assertEqual(list(cache), [2020, 2021])
+        self.assertEqual(cache.pop(2020), 'a')
+        self.assertIsNone(cache.pop(2020, None))
+        del cache[2021]
+        self.assertEqual(len(cache), 0)
+        cache[2022] = 'c'
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class SharedCacheTest(TestCase):
+
+    def test_disabled_by_default(self):
+        cache = SharedCache()
+        self.assertFalse(cache.enabled)
+
+    def test_enable_disable(self):
+        cache = SharedCache()
+        cache.enable()
+        self.assertTrue(cache.enabled)
+        cache.set('key', 'value')
+        self.assertEqual(cache.get('key'), 'value')
+        self.assertIsNone(cache.get('unknown'))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.set('key', 'value')
+        cache.disable()
+        self.assertFalse(cache.enabled)
+        self.assertEqual(len(cache), 0)
+
+    def test_max_entries(self):
+        cache = SharedCache()
+        cache.enable(max_entries=2)
+        for key in range(5):
+            cache.set(key, key)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(cache.get(4), 4)
+
+
+class PersistentCacheTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / 'sub' / 'cache.sqlite'
+        self.cache = PersistentCache()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(self.cache.enabled)
+
+    def test_get_set(self):
+        self.cache.enable(self.path)
+        self.assertTrue(self.cache.enabled)
+        self.assertTrue(self.path.exists())
+        holidays = [(date(2018, 1, 1), 'New year'), (date(2018, 12, 25), 'X')]
+        self.assertIsNone(self.cache.get(LRUCache, ((), ()), 2018))
+        self.cache.set(LRUCache, ((), ()), 2018, holidays)
+        self.assertEqual(self.cache.get(LRUCache, ((), ()), 2018), holidays)
+        # Other configuration, other year
+        self.assertIsNone(self.cache.get(LRUCache, ((1,), ()), 2018))
+        self.assertIsNone(self.cache.get(LRUCache, ((), ()), 2019))
+
+    def test_survives_instances(self):
+        self.cache.enable(self.path)
+        holidays = [(date(2018, 1, 1), 'New year')]
+        self.cache.set(LRUCache, ((), ()), 2018, holidays)
+        other = PersistentCache()
+        other.enable(self.path)
+        self.assertEqual(other.get(LRUCache, ((), ()), 2018), holidays)
+        other.clear()
+        self.assertIsNone(self.cache.get(LRUCache, ((), ()), 2018))
+
+    def test_keyed_by_version(self):
+        self.cache.enable(self.path)
+        holidays = [(date(2018, 1, 1), 'New year')]
+        self.cache.set(LRUCache, ((), ()), 2018, holidays)
+        with patch('workalendar.cache.__version__', 'another'):
+            self.assertIsNone(self.cache.get(LRUCache, ((), ()), 2018))
+
+    def test_broken_database(self):
+        self.cache.enable(self.path)
+        self.cache.disable()
+        self.path.write_bytes(b'not a database' * 100)
+        self.cache.path = self.path
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(self.cache.get(LRUCache, ((), ()), 2018))
+        with self.assertWarns(UserWarning):
+            self.cache.set(LRUCache, ((), ()), 2018, [])
+
+
+class UserCacheDirTest(TestCase):
+
+    def test_environment_variable(self):
+        with patch.dict('os.environ', {'WORKALENDAR_CACHE_DIR': '/tmp/wk'}):
+            self.assertEqual(user_cache_dir(), Path('/tmp/wk'))
+
+    @patch('workalendar.cache.sys.platform', 'linux')
+    def test_xdg_cache_home(self):
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': '/tmp/xdg'}):
+            os.environ.pop('WORKALENDAR_CACHE_DIR', None)
+            self.assertEqual(user_cache_dir(), Path('/tmp/xdg/workalendar'))
+        with patch.dict('os.environ'):
+            os.environ.pop('WORKALENDAR_CACHE_DIR', None)
+            os.environ.pop('XDG_CACHE_HOME', None)
+            self.assertEqual(
+                user_cache_dir(), Path.home() / '.cache' / 'workalendar'
+            )
+
+
+class AstronomyCacheTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patcher = patch.dict(
+            'os.environ', {'WORKALENDAR_CACHE_DIR': self.temp_dir.name}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = Path(self.temp_dir.name) / 'astronomy.sqlite'
+        self.cache = AstronomyCache()
+
+    def test_enabled_on_first_use(self):
+        self.assertFalse(self.cache.enabled)
+        self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2100))
+        self.assertTrue(self.cache.enabled)
+        self.assertEqual(self.cache.path, self.path)
+        self.assertTrue(self.path.exists())
+
+    def test_get_set(self):
+        self.cache.set('backend', 'f', 'UTC', 2100, 15, [1, 2])
+        self.assertEqual(
+            self.cache.get('backend', 'f', 'UTC', 2100, 15), [1, 2]
+        )
+        # Other keys
+        self.assertIsNone(self.cache.get('other', 'f', 'UTC', 2100, 15))
+        self.assertIsNone(self.cache.get('backend', 'g', 'UTC', 2100, 15))
+        self.assertIsNone(
+            self.cache.get('backend', 'f', 'Asia/Tokyo', 2100, 15)
+        )
+        self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2101, 15))
+        self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2100, 30))
+        with patch('workalendar.cache.__version__', 'another'):
+            self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2100, 15))
+        # Backend version
+        self.cache.set(
+            'backend', 'f', 'UTC', 2100, 15, [3], backend_version='1.0'
+        )
+        self.assertEqual(
+            self.cache.get('backend', 'f', 'UTC', 2100, 15, '1.0'), [3]
+        )
+        self.assertIsNone(
+            self.cache.get('backend', 'f', 'UTC', 2100, 15, '2.0')
+        )
+        self.assertEqual(
+            self.cache.get('backend', 'f', 'UTC', 2100, 15), [1, 2]
+        )
+        # Shared with the other processes
+        other = AstronomyCache()
+        self.assertEqual(other.get('backend', 'f', 'UTC', 2100, 15), [1, 2])
+        other.clear()
+        self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2100, 15))
+
+    def test_disabled(self):
+        self.cache.disable()
+        self.cache.set('backend', 'f', 'UTC', 2100, 15, [1, 2])
+        self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2100, 15))
+        self.assertFalse(self.path.exists())
+
+    def test_enable_elsewhere(self):
+        path = Path(self.temp_dir.name) / 'sub' / 'other.sqlite'
+        self.cache.enable(path)
+        self.cache.set('backend', 'f', 'UTC', 2100, 15, [1, 2])
+        self.assertTrue(path.exists())
+        self.assertFalse(self.path.exists())
+
+    def test_unavailable_directory(self):
+        # A file where the directory should be
+        Path(self.temp_dir.name, 'file').write_bytes(b'')
+        with patch.dict('os.environ', {
+            'WORKALENDAR_CACHE_DIR': str(Path(self.temp_dir.name, 'file'))
+        }):
+            with self.assertWarns(UserWarning):
+                self.assertIsNone(self.cache.get('backend', 'f', 'UTC', 2100))
+            self.assertFalse(self.cache.enabled)
+            # Only tried once
+            self.cache.set('backend', 'f', 'UTC', 2100, 0, [1])
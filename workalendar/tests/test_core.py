@@ -1,9 +1,20 @@
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 from unittest.mock import patch
 from datetime import date
 from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
 from unittest import TestCase
 
+import convertdate
 import pandas
+from dateutil import easter
+from lunardate import LunarDate
 
 from . import CoreCalendarTest, GenericCalendarTest
 from ..core import (
@@ -11,9 +22,13 @@ from ..core import (
     ISO_TUE, ISO_FRI,
     Calendar, LunarMixin, WesternCalendar,
     CalverterMixin, IslamicMixin,
-    daterange,
+    daterange, year_bitmap, is_bit_set, jan_1st_ordinal,
+    DateSet, as_date_set, easter_sunday, converted_to_gregorian,
+    lunar_months, LazyModule,
+    EASTER_JULIAN, EASTER_ORTHODOX, EASTER_WESTERN,
 )
 from ..exceptions import UnsupportedDateType, CalendarError
+from ..cache import LRUCache, shared_cache, persistent_cache
 
 
 class CalendarTest(CoreCalendarTest):
@@ -34,6 +49,32 @@ class CalendarTest(CoreCalendarTest):
         self.assertTrue(isinstance(holidays, (tuple, list)))
         self.assertEqual(self.cal._holidays[self.year], holidays)
 
+    def test_cache_policy(self):
+        self.cal.holidays(2011)
+        self.cal.set_cache_policy(max_years=2)
+        self.assertIsInstance(self.cal._holidays, LRUCache)
+        self.assertNotIn(2011, self.cal._holidays)
+        for year in (2011, 2012, 2013):
+            self.cal.holidays(year)
+        self.assertEqual(list(self.cal._holidays), [2012, 2013])
+        # Back to the default
+        self.cal.set_cache_policy()
+        self.assertEqual(self.cal._holidays, {})
+
+    def test_clear_cache_evict(self):
+        cal = MockChristianCalendar()
+        cal.is_working_day(date(2011, 1, 3))
+        cal.get_working_days_delta(date(2012, 1, 3), date(2012, 1, 4))
+        cal.evict(2011)
+        for cache in cal._get_caches():
+            self.assertNotIn(2011, cache)
+            self.assertIn(2012, cache)
+        # Evicting an unknown year is harmless
+        cal.evict(1900)
+        cal.clear_cache()
+        for cache in cal._get_caches():
+            self.assertEqual(len(cache), 0)
+
     def test_another_year(self):
         holidays = self.cal.holidays(2011)
         self.assertTrue(isinstance(holidays, (tuple, list)))
@@ -143,6 +184,33 @@ class LunarCalendarTest(TestCase):
             date(2014, 1, 31)
         )
 
+    def test_matches_lunardate(self):
+        for year in (1900, 2014, 2020, 2099):
+            for month in range(1, 13):
+                for day in (1, 15, 29):
+                    self.assertEqual(
+                        LunarMixin.lunar(year, month, day),
+                        LunarDate(year, month, day).toSolarDate()
+                    )
+
+    def test_month_length(self):
+        # 1st lunar month of 2020 has 29 days
+        self.assertEqual(lunar_months(2020)[0][1], 29)
+        self.assertEqual(LunarMixin.lunar(2020, 1, 29), date(2020, 2, 22))
+        with self.assertRaises(ValueError):
+            LunarMixin.lunar(2020, 1, 30)
+        with self.assertRaises(ValueError):
+            LunarMixin.lunar(2020, 13, 1)
+        with self.assertRaises(ValueError):
+            LunarMixin.lunar(2200, 1, 1)
+
+    def test_no_lunardate_churn(self):
+        LunarMixin.lunar(2014, 1, 1)
+        with patch('lunardate.LunarDate') as mocked:
+            self.assertEqual(
+                LunarMixin.lunar(2014, 8, 15), date(2014, 9, 8))
+        mocked.assert_not_called()
+
 
 class MockCalendar(Calendar):
 
@@ -276,6 +344,42 @@ class IslamicMixinTest(CoreCalendarTest):
         days = self.cal.converted(2013)
         self.assertEqual(len(days), 365)
 
+    def test_calverted_years(self):
+        for year in range(1950, 2100):
+            expected = sorted({y for y, m, d in self.cal.converted(year)})
+            self.assertEqual(self.cal.calverted_years(year), expected)
+        # 2008 overlaps three Islamic years
+        self.assertEqual(self.cal.calverted_years(2008), [1428, 1429, 1430])
+
+
+class ConvertedToGregorianTest(TestCase):
+
+    def test_converted_to_gregorian(self):
+        # Islamic new year 1442
+        self.assertEqual(
+            converted_to_gregorian(convertdate.islamic, 1442, 1, 1),
+            date(2020, 8, 20))
+
+    def test_shared_by_calendars(self):
+        class IslamicCalendar(IslamicMixin, Calendar):
+            include_islamic_new_year = True
+
+        holidays = IslamicCalendar().holidays(2020)
+        with patch.object(convertdate.islamic, 'to_gregorian') as mocked:
+            self.assertEqual(IslamicCalendar().holidays(2020), holidays)
+        mocked.assert_not_called()
+
+
+class LazyModuleTest(TestCase):
+
+    def test_lazy_module(self):
+        class HebrewCalendar(CalverterMixin, Calendar):
+            conversion_method = LazyModule('convertdate.hebrew')
+
+        self.assertIs(HebrewCalendar.conversion_method, convertdate.hebrew)
+        self.assertIs(HebrewCalendar().conversion_method, convertdate.hebrew)
+        self.assertIs(IslamicMixin.conversion_method, convertdate.islamic)
+
 
 class CalverterClassNoConversionMethod(CalverterMixin):
     pass
@@ -350,6 +454,337 @@ class MockChristianCalendarTest(CoreCalendarTest):
         self.assertEqual(len(holidays), 2)
 
 
+class ConfigurableCalendar(WesternCalendar):
+    def __init__(self, include_boxing_day=False, **kwargs):
+        self.include_boxing_day = include_boxing_day
+        super().__init__(**kwargs)
+
+
+class SharedCacheCalendarTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        shared_cache.enable()
+
+    def tearDown(self):
+        shared_cache.disable()
+        super().tearDown()
+
+    def test_shared_between_instances(self):
+        holidays = ConfigurableCalendar().holidays(2018)
+        with patch.object(ConfigurableCalendar,
+                          'get_calendar_holidays') as mocked:
+            cal = ConfigurableCalendar()
+            self.assertEqual(cal.holidays(2018), holidays)
+            # Not the same list, instances can't alter each other's cache
+            self.assertIsNot(cal.holidays(2018), holidays)
+        mocked.assert_not_called()
+
+    def test_keyed_by_configuration(self):
+        ConfigurableCalendar().holidays(2018)
+        cal = ConfigurableCalendar(include_boxing_day=True)
+        self.assertIn(date(2018, 12, 26), cal.holidays_set(2018))
+        cal = ConfigurableCalendar(include_boxing_day=False)
+        self.assertNotIn(date(2018, 12, 26), cal.holidays_set(2018))
+
+    def test_unhashable_configuration(self):
+        cal = ConfigurableCalendar(include_boxing_day=[])
+        cal.holidays(2018)
+        self.assertEqual(len(shared_cache), 0)
+
+    def test_disabled(self):
+        shared_cache.disable()
+        ConfigurableCalendar().holidays(2018)
+        self.assertEqual(len(shared_cache), 0)
+
+
+class PersistentCacheCalendarTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        persistent_cache.enable(Path(self.temp_dir.name) / 'cache.sqlite')
+
+    def tearDown(self):
+        persistent_cache.disable()
+        shared_cache.disable()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_persistent(self):
+        holidays = ConfigurableCalendar().holidays(2018)
+        with patch.object(ConfigurableCalendar,
+                          'get_calendar_holidays') as mocked:
+            cal = ConfigurableCalendar()
+            self.assertEqual(cal.holidays(2018), holidays)
+        mocked.assert_not_called()
+        cal = ConfigurableCalendar(include_boxing_day=True)
+        self.assertIn(date(2018, 12, 26), cal.holidays_set(2018))
+
+    def test_fills_the_shared_cache(self):
+        ConfigurableCalendar().holidays(2018)
+        shared_cache.enable()
+        ConfigurableCalendar().holidays(2018)
+        self.assertEqual(len(shared_cache), 1)
+
+
+class SlowCalendar(WesternCalendar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.computations = 0
+
+    def get_calendar_holidays(self, year):
+        self.computations += 1
+        time.sleep(0.05)
+        return super().get_calendar_holidays(year)
+
+
+class ThreadSafetyTest(TestCase):
+
+    def test_single_flight(self):
+        cal = SlowCalendar()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def target():
+            barrier.wait()
+            results.append(cal.holidays(2018))
+
+        threads = [threading.Thread(target=target) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cal.computations, 1)
+        self.assertEqual(len(results), 8)
+        for result in results:
+            self.assertIs(result, results[0])
+        # No lock left behind
+        self.assertEqual(cal._year_locks, {})
+
+    def test_error_releases_lock(self):
+        cal = SlowCalendar()
+        with patch.object(WesternCalendar, 'get_calendar_holidays',
+                          side_effect=CalendarError):
+            with self.assertRaises(CalendarError):
+                cal.holidays(2018)
+        self.assertEqual(cal._year_locks, {})
+        self.assertTrue(cal.holidays(2018))
+
+    def test_pickle(self):
+        cal = SlowCalendar()
+        cal.set_cache_policy(max_years=5)
+        cal.holidays(2018)
+        other = pickle.loads(pickle.dumps(cal))
+        self.assertEqual(other.holidays(2018), cal.holidays(2018))
+        self.assertEqual(other.computations, 1)
+        other.holidays(2019)
+
+
+class ExtraWorkingDaysCalendar(WesternCalendar):
+    def get_extra_working_days(self, year):
+        days = super().get_extra_working_days(year)
+        days.append(date(year, 12, 25))
+        # a SAT in 2021
+        days.append(datetime(year, 2, 20, 10, 0))
+        return days
+
+
+class WorkingDaysBitmapTest(TestCase):
+
+    def test_bitmap_tools(self):
+        bitmap = year_bitmap([0, 9, 365])
+        self.assertEqual(len(bitmap), 46)
+        self.assertTrue(is_bit_set(bitmap, 0))
+        self.assertFalse(is_bit_set(bitmap, 1))
+        self.assertTrue(is_bit_set(bitmap, 9))
+        self.assertTrue(is_bit_set(bitmap, 365))
+
+    def test_jan_1st_ordinal(self):
+        for year in (1, 4, 100, 1900, 2000, 2020, 2021, 2100, 9999):
+            self.assertEqual(
+                jan_1st_ordinal(year), date(year, 1, 1).toordinal())
+
+    def test_bitmaps_are_cached(self):
+        cal = MockChristianCalendar()
+        bitmap = cal.get_working_days_bitmap(2021)
+        self.assertIs(cal.get_working_days_bitmap(2021), bitmap)
+        holidays = cal.get_holidays_bitmap(2021)
+        self.assertIs(cal.get_holidays_bitmap(2021), holidays)
+        with patch.object(cal, 'holidays_set') as holidays_set:
+            cal.is_working_day(date(2021, 12, 25))
+            cal.is_holiday(date(2021, 12, 25))
+        holidays_set.assert_not_called()
+
+    def test_bitmap_matches_rules(self):
+        cal = MockChristianCalendar()
+        holidays = cal.holidays_set(2020)
+        for offset, day in enumerate(daterange(
+                date(2020, 1, 1), date(2020, 12, 31))):
+            self.assertEqual(
+                is_bit_set(cal.get_holidays_bitmap(2020), offset),
+                day in holidays)
+            self.assertEqual(
+                is_bit_set(cal.get_working_days_bitmap(2020), offset),
+                day.weekday() < SAT and day not in holidays)
+        # Dec 31st of a leap year
+        self.assertTrue(cal.is_working_day(date(2020, 12, 31)))
+        self.assertFalse(cal.is_holiday(date(2020, 12, 31)))
+
+    def test_extra_working_days(self):
+        cal = ExtraWorkingDaysCalendar()
+        self.assertTrue(cal.is_holiday(date(2021, 12, 25)))
+        self.assertTrue(cal.is_working_day(date(2021, 12, 25)))
+        self.assertTrue(cal.is_working_day(date(2021, 2, 20)))
+        self.assertFalse(cal.is_working_day(date(2021, 2, 21)))
+        # Extra holidays have priority over the calendar extra working days
+        self.assertFalse(cal.is_working_day(
+            date(2021, 2, 20), extra_holidays=[date(2021, 2, 20)]))
+
+    def test_weekend_without_holidays(self):
+        cal = UnconfiguredCalendar()
+        # Weekend days don't need the holidays of their year
+        self.assertFalse(cal.is_working_day(date(2017, 3, 5)))
+        self.assertFalse(cal.is_working_day(date(2017, 3, 4)))
+        # ... unless they're shifted working days
+        self.assertTrue(cal.is_working_day(date(2017, 2, 18)))
+        with self.assertRaises(CalendarError):
+            cal.is_working_day(date(2017, 3, 6))
+        self.assertTrue(cal.is_working_day(date(2021, 2, 20)))
+        self.assertFalse(cal.is_working_day(date(2021, 2, 21)))
+
+
+class UnconfiguredCalendar(ExtraWorkingDaysCalendar):
+    "Only configured for 2021"
+
+    def get_calendar_holidays(self, year):
+        if year != 2021:
+            raise CalendarError(f"Need configure {year}")
+        return super().get_calendar_holidays(year)
+
+    def get_extra_working_days(self, year):
+        days = super().get_extra_working_days(year)
+        if year == 2017:
+            days.append(date(year, 2, 18))
+        return days
+
+
+class OverriddenWorkingDayCalendar(MockChristianCalendar):
+    """
+    Overrides is_working_day(): FRI 2021-03-05 is not a working day.
+    """
+    def is_working_day(self, day, *args, **kwargs):
+        if day == date(2021, 3, 5):
+            return False
+        return super().is_working_day(day, *args, **kwargs)
+
+
+class OverriddenHolidayCalendar(MockChristianCalendar):
+    """
+    Overrides is_holiday(): FRI 2021-03-05 is a holiday.
+    """
+    def is_holiday(self, day, *args, **kwargs):
+        if day == date(2021, 3, 5):
+            return True
+        return super().is_holiday(day, *args, **kwargs)
+
+
+class OverriddenWorkingDaysTest(TestCase):
+    """
+    The helpers honour the overridden is_working_day() / is_holiday().
+    """
+
+    def test_overridden(self):
+        for cal_class in (
+                OverriddenWorkingDayCalendar, OverriddenHolidayCalendar):
+            cal = cal_class()
+            self.assertFalse(cal.is_working_day(date(2021, 3, 5)))
+            self.assertEqual(
+                cal.add_working_days(date(2021, 3, 4), 1), date(2021, 3, 8))
+            self.assertEqual(
+                cal.sub_working_days(date(2021, 3, 8), 1), date(2021, 3, 4))
+            self.assertEqual(
+                cal.get_working_days_delta(
+                    date(2021, 3, 1), date(2021, 3, 8)), 4)
+            self.assertEqual(
+                cal.get_working_days_delta(
+                    date(2021, 3, 1), date(2021, 3, 8), include_start=True),
+                5)
+        # Extra working days have priority over the holidays
+        self.assertEqual(
+            OverriddenHolidayCalendar().add_working_days(
+                date(2021, 3, 4), 1, extra_working_days=[date(2021, 3, 5)]),
+            date(2021, 3, 5))
+
+    def test_matches_day_by_day(self):
+        cal = OverriddenHolidayCalendar()
+        day = date(2021, 2, 20)
+        for delta in (1, 7, 30, -1, -7, -30):
+            self.assertEqual(
+                cal.add_working_days(day, delta),
+                add_working_days_day_by_day(cal, day, delta),
+                delta)
+
+
+class EasterSundayTest(TestCase):
+
+    def test_easter_sunday(self):
+        self.assertEqual(
+            easter_sunday(2021, easter.EASTER_WESTERN), date(2021, 4, 4))
+        self.assertEqual(
+            easter_sunday(2021, easter.EASTER_ORTHODOX), date(2021, 5, 2))
+
+    def test_methods(self):
+        self.assertEqual(EASTER_JULIAN, easter.EASTER_JULIAN)
+        self.assertEqual(EASTER_ORTHODOX, easter.EASTER_ORTHODOX)
+        self.assertEqual(EASTER_WESTERN, easter.EASTER_WESTERN)
+
+    def test_memoized(self):
+        easter_sunday(2014, easter.EASTER_WESTERN)
+        with patch('dateutil.easter.easter') as mocked:
+            cal = MockChristianCalendar()
+            self.assertEqual(cal.get_easter_sunday(2014), date(2014, 4, 20))
+            cal.get_good_friday(2014)
+            cal.get_easter_monday(2014)
+            cal.get_whit_monday(2014)
+        mocked.assert_not_called()
+
+
+class DeferredImportsTest(TestCase):
+    """
+    Importing calendars doesn't import the date conversion libraries, nor the
+    cache storage libraries: they're imported when first needed.
+
+    The import time itself is measured by the ``benchmark-import`` script.
+    """
+
+    def imported_modules(self, name):
+        """
+        Import ``name`` in a new interpreter. Return the deferred modules it
+        has imported.
+        """
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys;'
+            f'import {name};'
+            'print(",".join(sorted('
+            ' m for m in sys.modules'
+            ' if m in ("dateutil.easter", "json", "sqlite3")'
+            ' or m.split(".")[0] in ("convertdate", "lunardate", "pyluach")'
+            ')))',
+        ])
+        return output.decode().strip()
+
+    def test_import_europe(self):
+        self.assertEqual(self.imported_modules('workalendar.europe'), '')
+
+    def test_import_usa(self):
+        self.assertEqual(self.imported_modules('workalendar.usa'), '')
+
+    def test_import_israel(self):
+        self.assertEqual(self.imported_modules('workalendar.asia.israel'), '')
+
+
 class NoWeekendCalendar(Calendar):
     """
     This calendar class has no WEEKEND_DAYS and no `get_weekend_days()` method.
@@ -563,6 +998,203 @@ class WorkingDaysDeltatest(TestCase):
             extra_holidays=[date(2018, 12, 24)])
         self.assertEqual(delta, 2)
 
+    def test_same_day_in_both_extra(self):
+        cal = MockChristianCalendar()
+        day1 = date(2018, 12, 21)
+        day2 = date(2018, 12, 26)
+        # Extra working days have priority over the extra holidays
+        delta = cal.get_working_days_delta(
+            day1, day2,
+            extra_working_days=[date(2018, 12, 24), date(2018, 12, 25)],
+            extra_holidays=[date(2018, 12, 24), date(2018, 12, 25)]
+        )
+        self.assertEqual(delta, 3)
+
+    def test_cumulative_counts(self):
+        cal = MockChristianCalendar()
+        counts = cal.get_working_days_counts(2020)
+        self.assertEqual(len(counts), 367)
+        self.assertEqual(counts[0], 0)
+        # Jan 1st is a holiday, Jan 2nd is a THU
+        self.assertEqual(counts[1], 0)
+        self.assertEqual(counts[2], 1)
+        # 262 weekdays in 2020, minus Jan 1st and Christmas
+        self.assertEqual(counts[-1], 260)
+        self.assertIs(cal.get_working_days_counts(2020), counts)
+
+    def test_matches_day_by_day_count(self):
+        cal = MockChristianCalendar()
+        extra_working_days = [date(2019, 12, 25), date(2020, 2, 1)]
+        extra_holidays = [date(2019, 7, 1), date(2020, 2, 1)]
+        start = date(2018, 11, 30)
+        for end in (date(2018, 12, 31), date(2019, 12, 25),
+                    date(2020, 2, 1), date(2021, 3, 3)):
+            for include_start in (False, True):
+                expected = sum(
+                    1 for day in daterange(start, end)
+                    if cal.is_working_day(
+                        day, extra_working_days, extra_holidays)
+                    and (include_start or day != start)
+                )
+                self.assertEqual(
+                    cal.get_working_days_delta(
+                        start, end, include_start,
+                        extra_working_days=extra_working_days,
+                        extra_holidays=extra_holidays),
+                    expected)
+
+
+def add_working_days_day_by_day(cal, day, delta, **kwargs):
+    "Reference implementation, walking day by day"
+    step = timedelta(days=1 if delta >= 0 else -1)
+    count = 0
+    while count < abs(delta):
+        day += step
+        if cal.is_working_day(day, **kwargs):
+            count += 1
+    return day
+
+
+class AddWorkingDaysTest(TestCase):
+
+    def test_matches_day_by_day(self):
+        cal = MockChristianCalendar()
+        day = date(2019, 12, 20)
+        for delta in (1, 2, 3, 7, 250, 700, -1, -3, -250, -700):
+            self.assertEqual(
+                cal.add_working_days(day, delta),
+                add_working_days_day_by_day(cal, day, delta),
+                delta)
+
+    def test_matches_day_by_day_with_extra(self):
+        cal = MockChristianCalendar()
+        day = date(2019, 12, 20)
+        kwargs = {
+            'extra_working_days': [
+                date(2019, 12, 21), date(2019, 12, 25), date(2020, 1, 6),
+                date(2018, 12, 25)],
+            'extra_holidays': [
+                date(2019, 12, 23), date(2019, 12, 25), date(2020, 1, 2),
+                date(2019, 12, 19)],
+        }
+        for delta in range(-12, 13):
+            self.assertEqual(
+                cal.add_working_days(day, delta, **kwargs),
+                add_working_days_day_by_day(cal, day, delta, **kwargs),
+                delta)
+
+    def test_far_extra_days(self):
+        cal = MockChristianCalendar()
+        day = date(2021, 3, 1)
+        counts = cal.get_working_days_counts
+
+        def get_working_days_counts(year):
+            # e.g. a calendar that isn't configured for these years
+            if not 2020 <= year <= 2022:
+                raise CalendarError(f"Need configure {year}")
+            return counts(year)
+
+        with patch.object(cal, 'get_working_days_counts',
+                          get_working_days_counts):
+            self.assertEqual(
+                cal.add_working_days(
+                    day, 5, extra_holidays=[date(2035, 1, 1)]),
+                date(2021, 3, 8))
+            self.assertEqual(
+                cal.add_working_days(
+                    day, 5, extra_working_days=[date(2090, 1, 6)]),
+                date(2021, 3, 8))
+            self.assertEqual(
+                cal.sub_working_days(
+                    day, 5, extra_working_days=[date(2001, 1, 6)]),
+                date(2021, 2, 22))
+
+    def test_large_delta(self):
+        cal = MockChristianCalendar()
+        day = date(2000, 1, 3)
+        result = cal.add_working_days(day, 10000)
+        self.assertEqual(cal.get_working_days_delta(day, result), 10000)
+        self.assertTrue(cal.is_working_day(result))
+        self.assertEqual(cal.sub_working_days(result, 10000), day)
+
+    def test_keep_datetime(self):
+        cal = MockChristianCalendar()
+        day = datetime(2019, 12, 24, 10, 30)
+        self.assertEqual(
+            cal.add_working_days(day, 1, keep_datetime=True),
+            datetime(2019, 12, 26, 10, 30))
+        self.assertEqual(
+            cal.sub_working_days(day, 2, keep_datetime=True),
+            datetime(2019, 12, 20, 10, 30))
+
+
+class DateSetTest(TestCase):
+
+    def test_date_set(self):
+        days = DateSet([
+            date(2018, 12, 25), datetime(2018, 12, 24, 10), date(2018, 12, 25)
+        ])
+        self.assertEqual(len(days), 2)
+        self.assertEqual(list(days), [date(2018, 12, 24), date(2018, 12, 25)])
+        self.assertIn(date(2018, 12, 24), days)
+        self.assertIn(datetime(2018, 12, 25, 12), days)
+        self.assertNotIn(date(2018, 12, 26), days)
+        self.assertFalse(DateSet())
+
+    def test_hashable(self):
+        days = DateSet([date(2018, 12, 24), date(2018, 12, 25)])
+        same_days = DateSet([date(2018, 12, 25), date(2018, 12, 24)])
+        self.assertEqual(days, same_days)
+        self.assertEqual(hash(days), hash(same_days))
+        self.assertEqual(len({days, same_days}), 1)
+        self.assertNotEqual(days, DateSet([date(2018, 12, 24)]))
+
+    def test_iter_after_before(self):
+        days = DateSet([
+            date(2018, 12, 24), date(2018, 12, 25), date(2018, 12, 31)
+        ])
+        self.assertEqual(
+            list(days.iter_after(date(2018, 12, 24))),
+            [date(2018, 12, 25), date(2018, 12, 31)])
+        self.assertEqual(
+            list(days.iter_before(date(2018, 12, 31))),
+            [date(2018, 12, 25), date(2018, 12, 24)])
+        self.assertEqual(list(days.iter_after(date(2018, 12, 31))), [])
+
+    def test_unsupported_type(self):
+        with self.assertRaises(UnsupportedDateType):
+            DateSet(['2018-12-24'])
+
+    def test_as_date_set(self):
+        days = DateSet([date(2018, 12, 24)])
+        self.assertIs(as_date_set(days), days)
+        self.assertIsNone(as_date_set(None))
+        self.assertIsNone(as_date_set([]))
+        self.assertEqual(as_date_set([date(2018, 12, 24)]), days)
+
+    def test_calendar_methods(self):
+        cal = MockChristianCalendar()
+        extra_working_days = DateSet([date(2018, 12, 25)])
+        extra_holidays = DateSet([date(2018, 12, 24)])
+        kwargs = {
+            'extra_working_days': extra_working_days,
+            'extra_holidays': extra_holidays,
+        }
+        # No new DateSet is built out of the given ones
+        with patch.object(DateSet, '__init__') as mocked:
+            self.assertFalse(cal.is_working_day(date(2018, 12, 24), **kwargs))
+            self.assertTrue(cal.is_working_day(date(2018, 12, 25), **kwargs))
+            self.assertTrue(cal.is_holiday(
+                date(2018, 12, 24), extra_holidays=extra_holidays))
+            self.assertEqual(
+                cal.get_working_days_delta(
+                    date(2018, 12, 21), date(2018, 12, 26), **kwargs),
+                2)
+            self.assertEqual(
+                cal.add_working_days(date(2018, 12, 21), 2, **kwargs),
+                date(2018, 12, 26))
+        mocked.assert_not_called()
+
 
 class NoDocstring(Calendar):
     pass
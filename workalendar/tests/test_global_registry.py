@@ -1,6 +1,13 @@
+import json
+import pathlib
+import tempfile
 from unittest import TestCase
+from unittest.mock import patch
 
-from ..registry import registry
+from ..registry import ManifestEntry, load_registry_manifest, registry
+from ..registry_tools import (
+    build_registry_manifest, create_registry_manifest
+)
 
 
 class GlobalRegistry(TestCase):
@@ -13,3 +20,36 @@ class GlobalRegistry(TestCase):
             self.assertTrue(klass.name)
             # All those properties are equivalent to the class docstring
             self.assertEqual(klass.name, klass.__doc__)
+
+    def test_manifest(self):
+        # The registry manifest is up to date with the standard modules.
+        # If not, run the `create-registry-manifest` script.
+        manifest = build_registry_manifest()
+        self.assertEqual(
+            {
+                code: ManifestEntry(
+                    entry['module'], entry['class'], entry['name']
+                )
+                for code, entry in manifest.items()
+            },
+            load_registry_manifest(),
+        )
+        self.assertEqual(list(manifest), list(registry.region_registry))
+
+    def test_create_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / 'registry.json'
+            with patch('workalendar.registry.registry_manifest_path', path):
+                create_registry_manifest()
+                manifest = load_registry_manifest()
+            self.assertEqual(
+                json.loads(path.read_text(encoding='utf-8')),
+                build_registry_manifest(),
+            )
+        self.assertEqual(
+            manifest['CH-GR'],
+            ManifestEntry(
+                'workalendar.europe.switzerland', 'Graubunden',
+                'Graubünden (Grisons)'
+            )
+        )
@@ -0,0 +1,32 @@
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+
+from .. import hebrew as mod
+
+
+class HebrewTest(TestCase):
+
+    def test_table_range(self):
+        self.assertEqual(
+            len(mod.NISAN_OFFSETS), mod.LAST_YEAR - mod.FIRST_YEAR + 1)
+
+    def test_table_matches_pyluach(self):
+        for year in range(mod.FIRST_YEAR, mod.LAST_YEAR + 1):
+            self.assertEqual(
+                mod.NISAN_OFFSETS[year - mod.FIRST_YEAR],
+                mod.compute_nisan_offset(year),
+                year)
+
+    def test_get_nisan_first(self):
+        self.assertEqual(mod.get_nisan_first(2017), date(2017, 3, 28))
+        self.assertEqual(mod.get_nisan_first(2024), date(2024, 4, 9))
+
+    def test_get_nisan_first_no_pyluach_in_range(self):
+        with patch.object(mod, 'compute_nisan_offset') as mocked:
+            mod.get_nisan_first(2017)
+        mocked.assert_not_called()
+
+    def test_get_nisan_first_out_of_range(self):
+        self.assertEqual(mod.get_nisan_first(2101), date(2101, 3, 31))
+        self.assertEqual(mod.get_nisan_first(1899), date(1899, 3, 12))
@@ -1,8 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-import json
 import pathlib
+import tempfile
 from unittest import TestCase
-from unittest.mock import MagicMock, call, patch, sentinel
+from unittest.mock import MagicMock, call, patch
 
 from freezegun import freeze_time
 
@@ -10,6 +11,46 @@ from .. import precomputed_astronomy as mod
 
 
 class PreComputedAstronomyTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        mod.load_astronomical_data.cache_clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = pathlib.Path(tmp.name) / 'astronomy.bin'
+        years = range(2021, 2024)
+        self.path.write_bytes(mod.pack_astronomical_data(
+            years,
+            {
+                'Europe/Paris': {
+                    year: (
+                        datetime.date(year=year, month=2, day=15),
+                        datetime.date(year=year, month=3, day=16),
+                    )
+                    for year in years
+                }
+            },
+            {
+                'Europe/Paris': {
+                    year: {
+                        degrees: datetime.date(year=year, month=7, day=21)
+                        for degrees in range(15, 360, 15)
+                    }
+                    for year in years
+                },
+                # Only 2022 has been computed for this one
+                'Europe/Berlin': {
+                    2022: {90: datetime.date(year=2022, month=7, day=22)},
+                },
+            },
+        ))
+        patcher = patch.object(mod, 'pre_computed_astronomy_path', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        mod.load_astronomical_data.cache_clear()
+        super().tearDown()
+
     def test_year_interval(self):
         self.assertEqual(mod.YEAR_INTERVAL, 30)
 
@@ -21,112 +62,157 @@ class PreComputedAstronomyTest(TestCase):
             'Asia/Tokyo',
         ))
 
-    def test_pre_computed_pathes(self):
-        self.assertEqual(
-            mod.pre_computed_equinoxes_path,
-            pathlib.Path(__file__).parent.parent / 'equinoxes.json.gz',
-        )
-        self.assertEqual(
-            mod.pre_computed_solar_terms_path,
-            pathlib.Path(__file__).parent.parent / 'solar_terms.json.gz',
-        )
-
-    @patch('workalendar.skyfield_astronomy.solar_term')
-    @patch('workalendar.skyfield_astronomy.calculate_equinoxes')
-    @patch('workalendar.precomputed_astronomy.gzip.open')
-    @patch('workalendar.precomputed_astronomy.YEAR_INTERVAL', 1)
-    @patch('workalendar.precomputed_astronomy.TIME_ZONES', ('Europe/Paris',))
-    @freeze_time('2022-01-01')
-    def test_create_astronomical_data(self,
-                                      gzipopen,
-                                      calculate_equinoxes,
-                                      solar_term):
-        equinoxes_file = MagicMock(name='equinoxes')
-        equinoxes_file.__enter__.return_value = equinoxes_file
-        solar_terms_file = MagicMock(name='solar_terms')
-        solar_terms_file.__enter__.return_value = solar_terms_file
-        gzipopen.side_effect = [equinoxes_file, solar_terms_file]
+    def mock_skyfield(self):
+        """
+        Patch the Skyfield functions, return their mocks.
+        """
+        calculate_equinoxes = patch(
+            'workalendar.skyfield_astronomy.calculate_equinoxes'
+        ).start()
+        solar_terms = patch(
+            'workalendar.skyfield_astronomy.solar_terms'
+        ).start()
+        self.addCleanup(patch.stopall)
         calculate_equinoxes.side_effect = lambda year, timezone: (
             datetime.date(year=year, month=2, day=15),
             datetime.date(year=year, month=3, day=16),
         )
-        solar_term.side_effect = lambda year, degrees, timezone: \
-            datetime.date(year=year, month=7, day=21)
-        mod.create_astronomical_data()
-        gzipopen.assert_has_calls([
-            call(mod.pre_computed_equinoxes_path, 'wb'),
-            call(mod.pre_computed_solar_terms_path, 'wb'),
-        ], any_order=True)
-        expected_equinoxes_dict = {
-            'Europe/Paris': {
-                '2021': ('2021-02-15', '2021-03-16'),
-                '2022': ('2022-02-15', '2022-03-16'),
-                '2023': ('2023-02-15', '2023-03-16'),
+        solar_terms.side_effect = lambda first_year, last_year, timezone: {
+            year: {
+                degrees: datetime.date(year=year, month=7, day=degrees // 15)
+                for degrees in range(15, 360, 15)
             }
+            for year in range(first_year, last_year + 1)
         }
-        equinoxes_file.write.assert_called_once_with(
-            json.dumps(expected_equinoxes_dict).encode('utf-8')
+        return calculate_equinoxes, solar_terms
+
+    def assertAstronomicalData(self, time_zones, years):
+        data = mod.AstronomicalData(self.path.read_bytes())
+        self.assertEqual(data.first_year, years[0])
+        self.assertEqual(data.year_count, len(years))
+        self.assertEqual(sorted(data.time_zones), sorted(time_zones))
+        for time_zone in time_zones:
+            for year in years:
+                self.assertEqual(
+                    data.get(time_zone, year, 1),
+                    datetime.date(year=year, month=3, day=16).toordinal()
+                )
+                self.assertEqual(
+                    data.get(time_zone, year, 2 + 3),
+                    datetime.date(year=year, month=7, day=4).toordinal()
+                )
+
+    @patch('workalendar.precomputed_astronomy.YEAR_INTERVAL', 1)
+    @patch('workalendar.precomputed_astronomy.TIME_ZONES', ('Europe/Paris',))
+    @freeze_time('2022-01-01')
+    def test_create_astronomical_data(self):
+        calculate_equinoxes, solar_terms = self.mock_skyfield()
+        self.path.unlink()
+        mod.create_astronomical_data(workers=1)
+        self.assertEqual(calculate_equinoxes.call_count, 3)
+        solar_terms.assert_has_calls([
+            call(2021, 2021, 'Europe/Paris'),
+            call(2022, 2022, 'Europe/Paris'),
+            call(2023, 2023, 'Europe/Paris'),
+        ])
+        self.assertAstronomicalData(['Europe/Paris'], range(2021, 2024))
+
+    def test_create_astronomical_data_range(self):
+        self.mock_skyfield()
+        progress = MagicMock(side_effect=lambda it, total: it)
+        mod.create_astronomical_data(
+            progress,
+            first_year=1990, last_year=1999,
+            time_zones=['Asia/Taipei', 'Europe/Paris'],
+            workers=1,
         )
-        expected_solar_terms_dict = {
-            'Europe/Paris': {
-                '2021': {str(i): '2021-07-21' for i in range(15, 360, 15)},
-                '2022': {str(i): '2022-07-21' for i in range(15, 360, 15)},
-                '2023': {str(i): '2023-07-21' for i in range(15, 360, 15)},
-            }
-        }
-        solar_terms_file.write.assert_called_once_with(
-            json.dumps(expected_solar_terms_dict).encode('utf-8')
+        self.assertEqual(progress.call_args[1], {'total': 20})
+        self.assertAstronomicalData(
+            ['Asia/Taipei', 'Europe/Paris'], range(1990, 2000)
         )
 
-    @patch('workalendar.precomputed_astronomy.gzip.decompress')
-    @patch('workalendar.precomputed_astronomy.pre_computed_equinoxes_path')
-    def test_calculate_equinoxes(self,
-                                 pre_computed_equinoxes_path,
-                                 decompress):
-        pre_computed_equinoxes_path.read_bytes.return_value = \
-            sentinel.some_equinoxes_bytes
-        decompress.return_value = json.dumps({
-            'Europe/Paris': {
-                '2021': ('2021-02-15', '2021-03-16'),
-                '2022': ('2022-02-15', '2022-03-16'),
-                '2023': ('2023-02-15', '2023-03-16'),
-            }
-        }).encode('utf-8')
+    def test_create_astronomical_data_pool(self):
+        self.mock_skyfield()
+        # Mocks can't cross processes boundaries
+        with patch.object(mod, 'ProcessPoolExecutor', ThreadPoolExecutor):
+            mod.create_astronomical_data(
+                first_year=1990, last_year=1999,
+                time_zones=['Asia/Taipei', 'Europe/Paris'],
+                workers=4,
+            )
+        self.assertAstronomicalData(
+            ['Asia/Taipei', 'Europe/Paris'], range(1990, 2000)
+        )
+
+    def test_create_astronomical_data_checkpoint(self):
+        calculate_equinoxes, solar_terms = self.mock_skyfield()
+        checkpoint = self.path.parent / 'checkpoint.jsonl'
+        mod.create_astronomical_data(
+            first_year=2020, last_year=2021, time_zones=['Europe/Paris'],
+            workers=1, checkpoint=checkpoint,
+        )
+        self.assertEqual(calculate_equinoxes.call_count, 2)
+        self.assertEqual(
+            sorted(mod.read_checkpoint(checkpoint)),
+            [('Europe/Paris', 2020), ('Europe/Paris', 2021)],
+        )
+        # Simulate a run interrupted while writing a unit
+        with checkpoint.open('a') as f:
+            f.write('{"timezone": "Asia/Taipei", "year": 20')
+        calculate_equinoxes.reset_mock()
+        # Adding a time zone and a year only computes the new units
+        mod.create_astronomical_data(
+            first_year=2020, last_year=2022,
+            time_zones=['Asia/Taipei', 'Europe/Paris'],
+            workers=1, checkpoint=checkpoint,
+        )
+        self.assertEqual(
+            sorted(call[0] for call in calculate_equinoxes.call_args_list),
+            [
+                (2020, 'Asia/Taipei'),
+                (2021, 'Asia/Taipei'),
+                (2022, 'Asia/Taipei'),
+                (2022, 'Europe/Paris'),
+            ]
+        )
+        self.assertAstronomicalData(
+            ['Asia/Taipei', 'Europe/Paris'], range(2020, 2023)
+        )
+        self.assertEqual(len(mod.read_checkpoint(checkpoint)), 6)
+
+    def test_read_missing_checkpoint(self):
+        self.assertEqual(mod.read_checkpoint(None), {})
+        self.assertEqual(
+            mod.read_checkpoint(self.path.parent / 'missing.jsonl'), {}
+        )
+
+    def test_load_once(self):
+        data = mod.load_astronomical_data()
+        self.assertIs(mod.load_astronomical_data(), data)
+        self.assertEqual(data.time_zones, {
+            'Europe/Berlin': 0,
+            'Europe/Paris': 1,
+        })
+
+    def test_unsupported_format(self):
+        self.path.write_bytes(b'JSON' + bytes(mod.HEADER.size))
+        with self.assertRaises(ValueError):
+            mod.load_astronomical_data()
+
+    def test_calculate_equinoxes(self):
         with self.assertRaises(NotImplementedError):
             mod.calculate_equinoxes(2100, 'Europe/Paris')
-        pre_computed_equinoxes_path.read_bytes.assert_called_once()
-        pre_computed_equinoxes_path.reset_mock()
-        decompress.assert_called_once_with(sentinel.some_equinoxes_bytes)
-        decompress.reset_mock()
+        with self.assertRaises(NotImplementedError):
+            mod.calculate_equinoxes(2022, 'Europe/London')
+        # Missing values
         with self.assertRaises(NotImplementedError):
             mod.calculate_equinoxes(2022, 'Europe/Berlin')
-        pre_computed_equinoxes_path.read_bytes.assert_called_once()
-        pre_computed_equinoxes_path.reset_mock()
-        decompress.assert_called_once_with(sentinel.some_equinoxes_bytes)
-        decompress.reset_mock()
         self.assertEqual(mod.calculate_equinoxes(2022, 'Europe/Paris'), (
             datetime.date(year=2022, month=2, day=15),
             datetime.date(year=2022, month=3, day=16),
         ))
-        pre_computed_equinoxes_path.read_bytes.assert_called_once()
-        pre_computed_equinoxes_path.reset_mock()
-        decompress.assert_called_once_with(sentinel.some_equinoxes_bytes)
-        decompress.reset_mock()
-
-    @patch('workalendar.precomputed_astronomy.gzip.decompress')
-    @patch('workalendar.precomputed_astronomy.pre_computed_solar_terms_path')
-    def test_sorted_term(self,
-                         pre_computed_solar_terms_path,
-                         decompress):
-        pre_computed_solar_terms_path.read_bytes.return_value = \
-            sentinel.some_solar_terms_bytes
-        decompress.return_value = json.dumps({
-            'Europe/Paris': {
-                '2021': {str(i): '2021-07-21' for i in range(15, 360, 15)},
-                '2022': {str(i): '2022-07-21' for i in range(15, 360, 15)},
-                '2023': {str(i): '2023-07-21' for i in range(15, 360, 15)},
-            }
-        }).encode('utf-8')
+
+    def test_sorted_term(self):
         with self.assertRaises(ValueError):
             mod.solar_term(2022, 0, 'Europe/Paris')
         with self.assertRaises(ValueError):
@@ -135,21 +221,44 @@ class PreComputedAstronomyTest(TestCase):
             mod.solar_term(2022, 20, 'Europe/Paris')
         with self.assertRaises(NotImplementedError):
             mod.solar_term(2100, 45, 'Europe/Paris')
-        pre_computed_solar_terms_path.read_bytes.assert_called_once()
-        pre_computed_solar_terms_path.reset_mock()
-        decompress.assert_called_once_with(sentinel.some_solar_terms_bytes)
-        decompress.reset_mock()
         with self.assertRaises(NotImplementedError):
-            mod.solar_term(2022, 90, 'Europe/Berlin')
-        pre_computed_solar_terms_path.read_bytes.assert_called_once()
-        pre_computed_solar_terms_path.reset_mock()
-        decompress.assert_called_once_with(sentinel.some_solar_terms_bytes)
-        decompress.reset_mock()
+            mod.solar_term(2022, 90, 'Europe/London')
+        # Missing values
+        with self.assertRaises(NotImplementedError):
+            mod.solar_term(2021, 90, 'Europe/Berlin')
+        with self.assertRaises(NotImplementedError):
+            mod.solar_term(2022, 45, 'Europe/Berlin')
+        self.assertEqual(
+            mod.solar_term(2022, 90, 'Europe/Berlin'),
+            datetime.date(year=2022, month=7, day=22),
+        )
         self.assertEqual(
             mod.solar_term(2022, 90, 'Europe/Paris'),
             datetime.date(year=2022, month=7, day=21),
         )
-        pre_computed_solar_terms_path.read_bytes.assert_called_once()
-        pre_computed_solar_terms_path.reset_mock()
-        decompress.assert_called_once_with(sentinel.some_solar_terms_bytes)
-        decompress.reset_mock()
+
+
+class ShippedAstronomicalDataTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        mod.load_astronomical_data.cache_clear()
+
+    def test_pre_computed_path(self):
+        self.assertEqual(
+            mod.pre_computed_astronomy_path,
+            pathlib.Path(__file__).parent.parent / 'astronomy.bin',
+        )
+
+    def test_shipped_data(self):
+        data = mod.load_astronomical_data()
+        self.assertEqual(data.first_year, 1991)
+        self.assertEqual(data.year_count, 61)
+        self.assertEqual(sorted(data.time_zones), list(mod.TIME_ZONES))
+        self.assertEqual(
+            mod.calculate_equinoxes(2010, 'Asia/Taipei'),
+            (datetime.date(2010, 3, 21), datetime.date(2010, 9, 23)),
+        )
+        self.assertEqual(
+            mod.solar_term(2018, 15, 'Asia/Hong_Kong'),
+            datetime.date(2018, 4, 5),
+        )
@@ -1,8 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import sys
 from unittest import TestCase
+from unittest.mock import patch
 
 from ..core import Calendar
 from ..exceptions import ISORegistryError
 from ..registry import IsoRegistry
+from .. import registry as registry_module
 
 
 class RegionCalendar(Calendar):
@@ -57,6 +62,28 @@ class NonStandardRegistryTest(TestCase):
         self.assertEqual(1, len(subregions))
         self.assertIn('RE-SR', subregions)
 
+    def test_get_subregions_index(self):
+        registry = IsoRegistry(load_standard_modules=False)
+        registry.register('RE', self.region)
+        self.assertEqual(registry.get_subregions('RE'), {})
+        # Registered after a first query
+        registry.register('RE-SR', self.subregion)
+        registry.register('RE-SR-SSR', self.subregion)
+        registry.register('RE2-SR', self.subregion)
+        self.assertEqual(list(registry.get_subregions('RE')), [
+            'RE-SR', 'RE-SR-SSR'
+        ])
+        self.assertEqual(list(registry.get_subregions('RE-SR')), [
+            'RE-SR-SSR'
+        ])
+        self.assertEqual(registry.get_subregions('RE-SR-SSR'), {})
+        # Registering again doesn't duplicate
+        registry.register('RE-SR', self.region)
+        self.assertEqual(registry.get_subregions('RE'), {
+            'RE-SR': self.region,
+            'RE-SR-SSR': self.subregion,
+        })
+
     def test_get_calendars(self):
         registry = IsoRegistry(load_standard_modules=False)
         registry.register('RE', self.region)
@@ -130,3 +157,241 @@ class NonStandardRegistryTest(TestCase):
         calendars = registry.get_calendars(include_subregions=True)
         self.assertEqual(len(calendars), 4)
         self.assertEqual({"RE", "RE2", "RE3", "RE-SR"}, set(calendars))
+
+
+class LazyRegistryTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(
+            registry_module, 'import_module',
+            wraps=registry_module.import_module,
+        )
+        self.import_module = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def imported_modules(self):
+        return {call[0][0] for call in self.import_module.call_args_list}
+
+    def test_nothing_loaded(self):
+        IsoRegistry()
+        self.import_module.assert_not_called()
+
+    def test_standard_modules(self):
+        class EuropeRegistry(IsoRegistry):
+            STANDARD_MODULES = ('europe',)
+
+        registry = EuropeRegistry()
+        self.assertEqual(registry.get('FR').__name__, 'France')
+        self.assertIsNone(registry.get('JP'))
+        self.assertIsNone(registry.get('US'))
+        self.assertEqual(
+            set(registry.get_names()), set(registry.get_calendars())
+        )
+        for cls in registry.get_calendars(include_subregions=True).values():
+            self.assertTrue(cls.__module__.startswith('workalendar.europe.'))
+
+    def test_get(self):
+        registry = IsoRegistry()
+        self.assertEqual(registry.get('FR').__name__, 'France')
+        self.assertEqual(registry.get('FR-XX'), None)
+        self.assertEqual(
+            self.imported_modules(), {'workalendar.europe.france'}
+        )
+        self.assertEqual(registry.get('JP').__name__, 'Japan')
+        self.assertEqual(
+            self.imported_modules(),
+            {'workalendar.europe.france', 'workalendar.asia.japan'}
+        )
+
+    def test_get_unknown(self):
+        registry = IsoRegistry()
+        self.assertIsNone(registry.get('XX'))
+        self.import_module.assert_not_called()
+
+    def test_get_subregions(self):
+        registry = IsoRegistry()
+        subregions = registry.get_subregions('US')
+        self.assertIn('US-TX', subregions)
+        self.assertEqual(
+            self.imported_modules(),
+            {cls.__module__ for cls in subregions.values()},
+        )
+
+    def test_get_calendars(self):
+        registry = IsoRegistry()
+        calendars = registry.get_calendars(['AU', 'NZ'])
+        self.assertEqual(set(calendars), {'AU', 'NZ'})
+        self.assertEqual(self.imported_modules(), {
+            'workalendar.oceania.australia',
+            'workalendar.oceania.new_zealand',
+        })
+        calendars = registry.get_calendars()
+        self.assertIn('FR', calendars)
+        self.assertIn('ZA', calendars)
+
+    def test_get_names(self):
+        registry = IsoRegistry()
+        self.assertEqual(
+            registry.get_names(['FR', 'CH', 'XX']),
+            {'FR': 'France', 'CH': 'Switzerland'},
+        )
+        names = registry.get_names(['CH'], include_subregions=True)
+        self.assertEqual(len(names), 27)
+        self.assertEqual(names['CH-VD'], 'Vaud')
+        names = registry.get_names()
+        self.assertEqual(names['US'], 'United States of America')
+        self.assertNotIn('US-TX', names)
+        self.assertIn('US-TX', registry.get_names(include_subregions=True))
+        self.import_module.assert_not_called()
+        # Once loaded, or registered explicitly
+        registry.get('FR')
+        registry.register('RE', RegionCalendar)
+        self.assertEqual(
+            registry.get_names(['FR', 'RE']),
+            {'FR': 'France', 'RE': 'Region'},
+        )
+
+    def test_region_registry(self):
+        registry = IsoRegistry()
+        self.assertIn('BR', registry.region_registry)
+        for cls in registry.region_registry.values():
+            self.assertTrue(issubclass(cls, Calendar))
+
+    def test_region_registry_read_only(self):
+        registry = IsoRegistry(load_standard_modules=False)
+        registry.register('RE', RegionCalendar)
+        with self.assertRaises(TypeError):
+            registry.region_registry['RE-SR'] = SubRegionCalendar
+        # A whole dict can be assigned: the subregions are indexed
+        registry.region_registry = {
+            'RE': RegionCalendar,
+            'RE-SR': SubRegionCalendar,
+        }
+        self.assertEqual(
+            registry.get_subregions('RE'), {'RE-SR': SubRegionCalendar}
+        )
+        self.assertEqual(dict(registry.region_registry), {
+            'RE': RegionCalendar,
+            'RE-SR': SubRegionCalendar,
+        })
+        with self.assertRaises(ISORegistryError):
+            registry.region_registry = {'XX': NotACalendarClass}
+        # Unchanged
+        self.assertEqual(len(registry.region_registry), 2)
+
+    def test_register_before_loading(self):
+        registry = IsoRegistry()
+        registry.register('FR', RegionCalendar)
+        registry.register('RE', RegionCalendar)
+        # The explicitly registered calendar prevails
+        self.assertEqual(registry.get('FR'), RegionCalendar)
+        self.assertEqual(registry.get('FR-XX'), None)
+        self.assertEqual(registry.get_calendars(['RE']), {
+            'RE': RegionCalendar
+        })
+        self.assertEqual(registry.region_registry['FR'], RegionCalendar)
+
+    def test_not_imported(self):
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys;'
+            'from workalendar.registry import registry;'
+            'registry.get_names(include_subregions=True);'
+            'registry.get("FR");'
+            'print(sorted(m for m in sys.modules'
+            ' if m in ("workalendar.europe", "workalendar.asia")))',
+        ])
+        self.assertEqual(output.decode().strip(), "['workalendar.europe']")
+
+
+class InstancePoolTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.registry = IsoRegistry()
+
+    def test_get_instance(self):
+        calendar = self.registry.get_instance('FR')
+        self.assertEqual(calendar.__class__.__name__, 'France')
+        self.assertIs(self.registry.get_instance('FR'), calendar)
+        self.assertIsNone(self.registry.get_instance('XX'))
+
+    def test_configuration(self):
+        calendar = self.registry.get_instance('NL')
+        self.assertFalse(calendar.include_carnival)
+        carnival = self.registry.get_instance('NL', include_carnival=True)
+        self.assertIsNot(carnival, calendar)
+        self.assertTrue(carnival.include_carnival)
+        self.assertIs(
+            self.registry.get_instance('NL', include_carnival=True), carnival
+        )
+        self.assertIs(self.registry.get_instance('NL'), calendar)
+
+    def test_unhashable_configuration(self):
+        registry = IsoRegistry(load_standard_modules=False)
+
+        class ConfigurableCalendar(Calendar):
+            "Configurable"
+
+            def __init__(self, days=None):
+                super().__init__()
+                self.days = days
+
+        registry.register('RE', ConfigurableCalendar)
+        calendar = registry.get_instance('RE', days=[1, 2])
+        self.assertEqual(calendar.days, [1, 2])
+        self.assertIsNot(registry.get_instance('RE', days=[1, 2]), calendar)
+
+    def test_prewarm(self):
+        calendar = self.registry.get_instance(
+            'FR', prewarm_years=range(2020, 2023)
+        )
+        self.assertEqual(sorted(calendar._holidays), [2020, 2021, 2022])
+        self.assertEqual(
+            sorted(calendar._working_days_counts), [2020, 2021, 2022]
+        )
+        # Other years, same instance
+        self.assertIs(
+            self.registry.get_instance('FR', prewarm_years=[2030]), calendar
+        )
+        self.assertEqual(
+            sorted(calendar._holidays), [2020, 2021, 2022, 2030]
+        )
+
+    def test_constructor_called_once(self):
+        calls = []
+
+        class CostlyCalendar(Calendar):
+            "Costly"
+
+            def __init__(self):
+                super().__init__()
+                calls.append(self)
+
+        self.registry.register('RE', CostlyCalendar)
+        for _ in range(3):
+            self.registry.get_instance('RE')
+        self.assertEqual(len(calls), 1)
+
+    def test_register_outdates_instances(self):
+        calendar = self.registry.get_instance('FR')
+        self.registry.register('FR', RegionCalendar)
+        self.assertIsInstance(self.registry.get_instance('FR'), RegionCalendar)
+        self.registry.register('FR', calendar.__class__)
+        self.assertIsNot(self.registry.get_instance('FR'), calendar)
+
+    def test_clear_instances(self):
+        calendar = self.registry.get_instance('FR')
+        self.registry.clear_instances()
+        self.assertIsNot(self.registry.get_instance('FR'), calendar)
+
+    def test_thread_safety(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            calendars = list(executor.map(
+                lambda _: self.registry.get_instance(
+                    'DE-BY', prewarm_years=[2020]
+                ),
+                range(32),
+            ))
+        self.assertEqual(len(set(map(id, calendars))), 1)
@@ -1,14 +1,18 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from math import pi
+import time
 from unittest.mock import patch
 
-from skyfield.api import Loader
-from skyfield_data import get_skyfield_data_path
-
+from .. import analytic_astronomy, astronomy, skyfield_astronomy
+from ..cache import AstronomyCache
 from ..skyfield_astronomy import (
     calculate_equinoxes,
+    get_current_longitude,
+    get_session,
     solar_term,
+    solar_terms,
     newton_angle_function,
 )
 
@@ -39,16 +43,113 @@ def test_qingming_festivals_hk():
     assert solar_term(2021, 15, 'Asia/Hong_Kong') == date(2021, 4, 4)
 
 
+def test_solar_terms():
+    terms = solar_terms(2016, 2021, 'Asia/Hong_Kong')
+    assert sorted(terms) == list(range(2016, 2022))
+    for year, year_terms in terms.items():
+        assert sorted(year_terms) == list(range(0, 360, 15))
+    # Qingming festivals
+    assert terms[2016][15] == date(2016, 4, 4)
+    assert terms[2018][15] == date(2018, 4, 5)
+    assert terms[2019][15] == date(2019, 4, 5)
+    assert terms[2020][15] == date(2020, 4, 4)
+    assert terms[2021][15] == date(2021, 4, 4)
+    # Dongzhi festival
+    assert terms[2021][270] == date(2021, 12, 21)
+
+
+def test_solar_terms_match_solar_term():
+    terms = solar_terms(2010, timezone='Asia/Taipei')
+    assert list(terms) == [2010]
+    for degrees in range(15, 360, 15):
+        assert terms[2010][degrees] == solar_term(2010, degrees, 'Asia/Taipei')
+
+
+def test_astronomy_cache(tmp_path):
+    cache = AstronomyCache()
+    cache.enable(tmp_path / 'astronomy.sqlite')
+    with patch.object(astronomy, 'astronomy_cache', cache), \
+            patch.object(skyfield_astronomy, 'solar_term',
+                         wraps=skyfield_astronomy.solar_term) as term, \
+            patch.object(skyfield_astronomy, 'calculate_equinoxes',
+                         wraps=calculate_equinoxes) as equinoxes:
+        for _ in range(2):
+            assert astronomy.solar_term(2001, 15, 'Asia/Taipei') == \
+                date(2001, 4, 5)
+            assert astronomy.calculate_equinoxes(2010, 'Asia/Taipei') == (
+                date(2010, 3, 21), date(2010, 9, 23)
+            )
+    term.assert_called_once_with(2001, 15, 'Asia/Taipei')
+    equinoxes.assert_called_once_with(2010, 'Asia/Taipei')
+    version = skyfield_astronomy.get_version()
+    assert cache.get(
+        'skyfield', 'solar_term', 'Asia/Taipei', 2001, 15, version
+    ) == [date(2001, 4, 5).toordinal()]
+    # Results of other Skyfield versions are ignored
+    with patch.object(skyfield_astronomy, 'get_version', return_value='x'):
+        with patch.object(astronomy, 'astronomy_cache', cache), \
+                patch.object(skyfield_astronomy, 'solar_term',
+                             wraps=skyfield_astronomy.solar_term) as term:
+            astronomy.solar_term(2001, 15, 'Asia/Taipei')
+        term.assert_called_once_with(2001, 15, 'Asia/Taipei')
+
+
+def test_version():
+    version = skyfield_astronomy.get_version()
+    assert 'skyfield ' in version
+    assert 'skyfield-data ' in version
+    assert skyfield_astronomy.EPHEMERIS in version
+
+
+def test_analytic_longitude_accuracy():
+    """
+    The analytic Sun longitude is precise to about 0.01 degree, and biased
+    (ahead of Skyfield's, hence the early solar terms).
+    """
+    session = get_session()
+    differences = []
+    # Every 10 days, from 1995 to 2049
+    for jde in range(2449718, 2469800, 10):
+        longitude = get_current_longitude(
+            session.ts.tt_jd(jde), session.earth, session.sun
+        ) * 180 / pi
+        analytic = analytic_astronomy.sun_longitude(jde, apparent=False)
+        differences.append((analytic - longitude + 180) % 360 - 180)
+    assert max(abs(difference) for difference in differences) < 0.01
+    assert 0.001 < sum(differences) / len(differences) < 0.004
+
+
+def test_session_is_loaded_once():
+    session = get_session()
+    with patch.object(skyfield_astronomy, 'Loader') as loader:
+        assert calculate_equinoxes(2010) == (
+            date(2010, 3, 20), date(2010, 9, 23)
+        )
+        assert solar_term(2001, 15) == date(2001, 4, 4)
+        assert get_session() is session
+    loader.assert_not_called()
+
+
+def test_session_thread_safety():
+    with patch.object(skyfield_astronomy, '_session', None), \
+            patch.object(skyfield_astronomy, 'EphemerisSession') as factory:
+        # A slow session load, so that threads are competing for it
+        factory.side_effect = lambda: time.sleep(.05) or object()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: get_session(), range(32)))
+    factory.assert_called_once_with()
+    assert len(set(map(id, sessions))) == 1
+
+
 @pytest.fixture(scope='session')
 def params_newton_angle():
     """
     Session-scoped fixture to "cache" the newton angle func parameters
     """
-    load = Loader(get_skyfield_data_path())
-    ts = load.timescale()
-    planets = load('de421.bsp')
-    earth = planets['earth']
-    sun = planets['sun']
+    session = get_session()
+    ts = session.ts
+    earth = session.earth
+    sun = session.sun
 
     jan_first = ts.utc(date(2021, 1, 1))
     t0 = ts.tt_jd(jan_first.tt).tt
@@ -1,6 +1,5 @@
 from datetime import date, timedelta
 import warnings
-from pyluach.dates import GregorianDate
 
 from .core import UnitedStates
 from ..registry_tools import iso_register
@@ -16,6 +15,7 @@ class HebrewHolidays:
         Build and cache the Hebrew calendar for the given Gregorian Year.
         """
         if gregorian_year not in cls.hebrew_calendars:
+            from pyluach.dates import GregorianDate
             # Build the hebrew calendar for year
             days = []
             current_date = date(gregorian_year, 1, 1)